@@ -1,13 +1,28 @@
 """Alert handlers - Telegram, Pushover, Discord, and Slack"""
 
+import json
 import time
-from typing import Dict, Optional, List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import count
+from time import monotonic as _now
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .rate_limiter import TokenBucketRateLimiter
 from .logger import get_logger
 
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 logger = get_logger()
 
 # Default cooldown period for Pushover CRITICAL alerts (30 minutes)
@@ -17,6 +32,65 @@ PUSHOVER_CRITICAL_COOLDOWN_SECONDS = 30 * 60
 # Maximum number of failed alerts to queue for retry
 MAX_FAILED_ALERTS_QUEUE_SIZE = 10
 
+# Emergency priority (2) requires retry and expire: retry every 30 seconds and
+# keep retrying for 1 hour
+_PUSHOVER_EMERGENCY_EXTRAS = MappingProxyType({"retry": 30, "expire": 3600})
+
+# Queued alerts are retried as combined messages of up to this many characters
+# (message text only), leaving room under Telegram's 4096-character message
+# and Discord's 4096-character embed description limits
+RETRY_BATCH_MAX_CHARS = 3500
+
+# (connect, read) timeout for alert POSTs - fail fast on an unreachable API
+ALERT_REQUEST_TIMEOUT = (3.05, 10)
+
+# Transient API errors are retried on the connection before an alert counts as
+# failed (and lands in the failed-alerts queue): up to 2 retries, 0s then 0.6s
+# apart. Only failures where the API cannot have acted on the POST are retried -
+# connect errors and explicit 5xx replies. Alert POSTs are not idempotent, so a
+# read timeout or dropped response (the API may have delivered the message) is
+# never re-sent. 429 is left to the local rate limiters - honoring Telegram's
+# Retry-After would stall the alert workers for the whole window.
+ALERT_RETRY_POLICY = Retry(
+    total=2,
+    read=0,
+    other=0,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+
+# Alert bodies are serialized up front, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class FailedAlert(NamedTuple):
+    """A critical alert that failed on every channel, waiting for retry"""
+
+    message: str
+    validator_name: Optional[str]
+    failed_at: float  # Monotonic clock reading of the original failure
+
+
+def _retry_batches(entries: Iterable[FailedAlert]) -> Iterator[List[FailedAlert]]:
+    """Group consecutive queued alerts into batches of up to RETRY_BATCH_MAX_CHARS.
+
+    An alert longer than the cap gets a batch of its own.
+    """
+    batch: List[FailedAlert] = []
+    size = 0
+    for entry in entries:
+        length = len(entry.message)
+        if batch and size + length > RETRY_BATCH_MAX_CHARS:
+            yield batch
+            batch = []
+            size = 0
+        batch.append(entry)
+        size += length
+    if batch:
+        yield batch
+
 
 class AlertHandler:
     """Handle alerts via Telegram, Pushover, Discord, and Slack with rate limiting
@@ -31,6 +105,36 @@ class AlertHandler:
     TELEGRAM_API = "https://api.telegram.org/bot{token}/sendMessage"
     PUSHOVER_API = "https://api.pushover.net/1/messages.json"
 
+    # Fixed attribute layout (no per-instance __dict__); keep in sync with __init__
+    __slots__ = (
+        "telegram_token",
+        "telegram_chat_id",
+        "pushover_user_key",
+        "pushover_app_token",
+        "discord_webhook_url",
+        "slack_webhook_url",
+        "pushover_critical_cooldown",
+        "_telegram_url",
+        "_pushover_auth",
+        "_telegram_limiter",
+        "_pushover_limiter",
+        "_discord_limiter",
+        "_slack_limiter",
+        "_telegram_consume",
+        "_pushover_consume",
+        "_discord_consume",
+        "_slack_consume",
+        "_session",
+        "_post",
+        "_executor",
+        "_critical_sent_counter",
+        "_critical_dropped_counter",
+        "_critical_alerts_sent",
+        "_critical_alerts_dropped",
+        "_pushover_critical_last_sent",
+        "_failed_alerts_queue",
+    )
+
     def __init__(
         self,
         telegram_token: str,
@@ -53,6 +157,10 @@ class AlertHandler:
         self.slack_webhook_url = slack_webhook_url
         self.pushover_critical_cooldown = pushover_critical_cooldown
 
+        # Per-handler constants of every request, built once instead of per send
+        self._telegram_url = self.TELEGRAM_API.format(token=telegram_token)
+        self._pushover_auth = {"user": pushover_user_key, "token": pushover_app_token}
+
         # Initialize rate limiters
         self._telegram_limiter = TokenBucketRateLimiter(
             max_tokens=telegram_rate_limit,
@@ -70,18 +178,46 @@ class AlertHandler:
             max_tokens=slack_rate_limit,
             refill_rate=slack_rate_limit / 60.0
         )
-
-        # Track critical alerts sent (for monitoring)
+        # Pre-bound consume() of each limiter for the per-alert send path
+        self._telegram_consume = self._telegram_limiter.consume
+        self._pushover_consume = self._pushover_limiter.consume
+        self._discord_consume = self._discord_limiter.consume
+        self._slack_consume = self._slack_limiter.consume
+
+        # Pooled keep-alive connections to the Telegram, Pushover, Discord and
+        # Slack APIs, so a burst of alerts doesn't pay a TLS handshake each
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=ALERT_RETRY_POLICY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._post = self._session.post
+
+        # One worker per channel so alert_critical() posts to all of them at once
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="alert")
+
+        # Track critical alerts sent (for monitoring). alert_critical() can run
+        # on several threads; next() on a count is a single atomic step, where
+        # "+= 1" can lose an update, and the attributes hold the latest value
+        self._critical_sent_counter = count(1)
+        self._critical_dropped_counter = count(1)
         self._critical_alerts_sent = 0
         self._critical_alerts_dropped = 0
 
         # Track last Pushover CRITICAL alert time per validator (for cooldown)
-        # Key: validator_name, Value: timestamp of last Pushover CRITICAL
+        # Key: validator_name, Value: monotonic clock reading of last Pushover CRITICAL
         self._pushover_critical_last_sent: Dict[str, float] = {}
 
         # Failed alerts queue for retry (prevents alert loss on network issues)
-        # Each entry: (message, validator_name, timestamp_failed)
-        self._failed_alerts_queue: List[Tuple[str, Optional[str], float]] = []
+        # The oldest entry falls off the front once MAX_FAILED_ALERTS_QUEUE_SIZE is reached
+        self._failed_alerts_queue: Deque[FailedAlert] = deque(
+            maxlen=MAX_FAILED_ALERTS_QUEUE_SIZE
+        )
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST a JSON payload (orjson when installed) over the pooled session"""
+        return self._post(
+            url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=ALERT_REQUEST_TIMEOUT
+        )
 
     def send_telegram(
         self,
@@ -107,11 +243,10 @@ class AlertHandler:
 
         # Check rate limit (unless bypassed for critical alerts)
         if not bypass_rate_limit:
-            if not self._telegram_limiter.consume(1):
+            if not self._telegram_consume(1):
                 logger.warning("Telegram rate limit exceeded - message dropped")
                 return False
 
-        url = self.TELEGRAM_API.format(token=self.telegram_token)
         payload = {
             "chat_id": self.telegram_chat_id,
             "text": message,
@@ -120,7 +255,7 @@ class AlertHandler:
         }
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._post_json(self._telegram_url, payload)
             response.raise_for_status()
             if bypass_rate_limit:
                 logger.info("Telegram CRITICAL alert sent (rate limit bypassed)")
@@ -156,48 +291,46 @@ class AlertHandler:
             return False
 
         # For CRITICAL alerts (priority 2), check cooldown
+        # (no entry means never sent - the monotonic clock starts near zero at boot)
         if priority == 2 and validator_name:
-            now = time.time()
-            last_sent = self._pushover_critical_last_sent.get(validator_name, 0)
-            time_since_last = now - last_sent
-
-            if time_since_last < self.pushover_critical_cooldown:
-                remaining = int(self.pushover_critical_cooldown - time_since_last)
-                logger.info(
-                    f"Pushover CRITICAL for {validator_name} in cooldown "
-                    f"({remaining}s remaining) - alert suppressed"
-                )
-                return False  # Cooldown active, suppress this alert
+            last_sent = self._pushover_critical_last_sent.get(validator_name)
+            if last_sent is not None:
+                time_since_last = _now() - last_sent
+
+                if time_since_last < self.pushover_critical_cooldown:
+                    remaining = int(self.pushover_critical_cooldown - time_since_last)
+                    logger.info(
+                        f"Pushover CRITICAL for {validator_name} in cooldown "
+                        f"({remaining}s remaining) - alert suppressed"
+                    )
+                    return False  # Cooldown active, suppress this alert
 
         # Check rate limit (unless bypassed for critical alerts)
         # Emergency alerts use more tokens normally, but bypass if critical
         if not bypass_rate_limit:
             tokens_needed = 2 if priority == 2 else 1
-            if not self._pushover_limiter.consume(tokens_needed):
+            if not self._pushover_consume(tokens_needed):
                 logger.warning("Pushover rate limit exceeded - message dropped")
                 return False
 
         payload = {
-            "user": self.pushover_user_key,
-            "token": self.pushover_app_token,
+            **self._pushover_auth,
             "message": message,
             "title": title,
             "priority": priority,
             "sound": sound,
         }
 
-        # Emergency priority (2) requires retry and expire
         if priority == 2:
-            payload["retry"] = 30  # Retry every 30 seconds
-            payload["expire"] = 3600  # Keep retrying for 1 hour
+            payload.update(_PUSHOVER_EMERGENCY_EXTRAS)
 
         try:
-            response = requests.post(self.PUSHOVER_API, json=payload, timeout=10)
+            response = self._post_json(self.PUSHOVER_API, payload)
             response.raise_for_status()
 
             # Update cooldown tracker for successful CRITICAL alerts
             if priority == 2 and validator_name:
-                self._pushover_critical_last_sent[validator_name] = time.time()
+                self._pushover_critical_last_sent[validator_name] = _now()
 
             if bypass_rate_limit:
                 logger.info(f"Pushover CRITICAL alert sent for {validator_name or 'unknown'}")
@@ -232,7 +365,7 @@ class AlertHandler:
 
         # Check rate limit (unless bypassed for critical alerts)
         if not bypass_rate_limit:
-            if not self._discord_limiter.consume(1):
+            if not self._discord_consume(1):
                 logger.warning("Discord rate limit exceeded - message dropped")
                 return False
 
@@ -254,7 +387,7 @@ class AlertHandler:
             payload["flags"] = 1 << 0  # SUPPRESS_NOTIFICATIONS
 
         try:
-            response = requests.post(self.discord_webhook_url, json=payload, timeout=10)
+            response = self._post_json(self.discord_webhook_url, payload)
             response.raise_for_status()
 
             if bypass_rate_limit:
@@ -290,7 +423,7 @@ class AlertHandler:
 
         # Check rate limit (unless bypassed for critical alerts)
         if not bypass_rate_limit:
-            if not self._slack_limiter.consume(1):
+            if not self._slack_consume(1):
                 logger.warning("Slack rate limit exceeded - message dropped")
                 return False
 
@@ -306,7 +439,7 @@ class AlertHandler:
         }
 
         try:
-            response = requests.post(self.slack_webhook_url, json=payload, timeout=10)
+            response = self._post_json(self.slack_webhook_url, payload)
             response.raise_for_status()
 
             if bypass_rate_limit:
@@ -349,50 +482,12 @@ class AlertHandler:
         Returns:
             True if at least one channel sent successfully, False otherwise
         """
-        telegram_success = False
-        pushover_success = False
-        discord_success = False
-        slack_success = False
-
-        # Telegram alert (bypasses rate limit)
-        telegram_success = self.send_telegram(
-            f"🔴 *CRITICAL*\n\n{message}",
-            bypass_rate_limit=True,
-        )
-
-        # Pushover emergency alert (has cooldown to prevent storms)
-        if self.pushover_user_key and self.pushover_app_token:
-            pushover_success = self.send_pushover(
-                message=message,
-                title="MONAD CRITICAL ALERT",
-                priority=2,  # Emergency priority
-                sound="persistent",  # Persistent sound for emergency
-                bypass_rate_limit=True,
-                validator_name=validator_name,
-            )
-
-        # Discord alert (bypasses rate limit for critical)
-        discord_success = self.send_discord(
-            message=message,
-            title="🔴 MONAD CRITICAL ALERT",
-            color=0xe74c3c,  # Red for critical
-            bypass_rate_limit=True,
-        )
-
-        # Slack alert (bypasses rate limit for critical)
-        slack_success = self.send_slack(
-            message=message,
-            title="🔴 MONAD CRITICAL ALERT",
-            color="#e74c3c",
-            bypass_rate_limit=True,
-        )
-
         # Track for monitoring
-        if telegram_success or pushover_success or discord_success or slack_success:
-            self._critical_alerts_sent += 1
+        if self._send_all(self._critical_sends(message, validator_name)):
+            self._critical_alerts_sent = next(self._critical_sent_counter)
             return True
         else:
-            self._critical_alerts_dropped += 1
+            self._critical_alerts_dropped = next(self._critical_dropped_counter)
             logger.error("CRITICAL alert failed to send on ALL channels!")
             # Queue for retry to prevent alert loss
             self._queue_failed_alert(message, validator_name)
@@ -436,6 +531,102 @@ class AlertHandler:
         )
         return telegram_success or discord_success or slack_success
 
+    def _critical_sends(self, message: str, validator_name: Optional[str]) -> List[Callable[[], bool]]:
+        """Build the per-channel sends for a critical alert.
+
+        Telegram/Discord/Slack bypass the rate limit; Pushover (only when
+        configured) uses emergency priority and the per-validator cooldown.
+
+        Args:
+            message: Alert message to send
+            validator_name: Optional validator name for Pushover cooldown tracking
+
+        Returns:
+            Zero-argument callables, one per channel
+        """
+        sends = self._critical_chat_sends(message)
+        if self.pushover_user_key and self.pushover_app_token:
+            sends.append(partial(self._send_pushover_critical, message, validator_name))
+        return sends
+
+    def _critical_chat_sends(self, message: str, retry: bool = False) -> List[Callable[[], bool]]:
+        """Build the Telegram, Discord and Slack sends for a critical alert (bypass rate limit)"""
+        suffix = " (Retry)" if retry else ""
+        body = f"[RETRY] {message}" if retry else message
+
+        return [
+            # Telegram alert (bypasses rate limit)
+            partial(
+                self.send_telegram,
+                f"🔴 *CRITICAL*{suffix}\n\n{message}",
+                bypass_rate_limit=True,
+            ),
+            # Discord alert (bypasses rate limit for critical)
+            partial(
+                self.send_discord,
+                message=body,
+                title=f"🔴 MONAD CRITICAL ALERT{suffix}",
+                color=0xe74c3c,  # Red for critical
+                bypass_rate_limit=True,
+            ),
+            # Slack alert (bypasses rate limit for critical)
+            partial(
+                self.send_slack,
+                message=body,
+                title=f"🔴 MONAD CRITICAL ALERT{suffix}",
+                color="#e74c3c",
+                bypass_rate_limit=True,
+            ),
+        ]
+
+    def _send_pushover_critical(
+        self,
+        message: str,
+        validator_name: Optional[str],
+        retry: bool = False,
+    ) -> bool:
+        """Send a Pushover emergency alert (has cooldown to prevent storms)"""
+        suffix = " (Retry)" if retry else ""
+        return self.send_pushover(
+            message=f"[RETRY] {message}" if retry else message,
+            title=f"MONAD CRITICAL ALERT{suffix}",
+            priority=2,  # Emergency priority
+            sound="persistent",  # Persistent sound for emergency
+            bypass_rate_limit=True,
+            validator_name=validator_name,
+        )
+
+    def _start_all(self, sends: List[Callable[[], bool]]) -> Callable[[], bool]:
+        """Start channel sends concurrently; the returned callable waits for all of them.
+
+        Falls back to sending inline once the pool has been shut down.
+
+        Returns:
+            Callable returning True if at least one channel sent successfully
+        """
+        try:
+            futures = [self._executor.submit(send) for send in sends]
+        except RuntimeError:
+            results = [send() for send in sends]
+            return lambda: any(results)
+        return lambda: any([future.result() for future in futures])
+
+    def _send_all(self, sends: List[Callable[[], bool]]) -> bool:
+        """Run channel sends concurrently and wait for every one of them.
+
+        Wall-clock time is the slowest channel rather than the sum of all of
+        them.
+
+        Returns:
+            True if at least one channel sent successfully, False otherwise
+        """
+        return self._start_all(sends)()
+
+    def close(self) -> None:
+        """Close alert workers and pooled HTTP connections to the alert APIs"""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
     def get_critical_stats(self) -> dict:
         """Get statistics about critical alerts (for monitoring)"""
         return {
@@ -463,18 +654,28 @@ class AlertHandler:
             message: The alert message that failed to send
             validator_name: Optional validator name
         """
+        # The same alert failing again during an outage is already waiting for
+        # retry; keep the original entry (and its age) instead of a duplicate
+        for queued in self._failed_alerts_queue:
+            if queued.message == message and queued.validator_name == validator_name:
+                logger.debug(f"Failed alert already queued for retry: {validator_name or 'unknown'}")
+                return
+
         if len(self._failed_alerts_queue) >= MAX_FAILED_ALERTS_QUEUE_SIZE:
-            # Remove oldest entry to make room
-            old_msg, old_val, _ = self._failed_alerts_queue.pop(0)
+            # append() below drops the oldest entry to make room
+            old_val = self._failed_alerts_queue[0].validator_name
             logger.warning(f"Dropping oldest failed alert to make room: {old_val or 'unknown'}")
 
-        self._failed_alerts_queue.append((message, validator_name, time.time()))
+        self._failed_alerts_queue.append(FailedAlert(message, validator_name, _now()))
         logger.info(f"Queued failed alert for retry: {validator_name or 'unknown'} (queue size: {len(self._failed_alerts_queue)})")
 
     def retry_failed_alerts(self) -> int:
         """Retry sending all failed alerts in the queue.
 
         Call this periodically from the main loop to retry failed alerts.
+        Consecutive alerts are combined into one Telegram/Discord/Slack message
+        (up to RETRY_BATCH_MAX_CHARS); Pushover still pages once per alert. An
+        alert counts as sent if its combined message or its page got through.
 
         Returns:
             Number of alerts successfully sent
@@ -483,51 +684,44 @@ class AlertHandler:
             return 0
 
         sent_count = 0
-        retry_queue = self._failed_alerts_queue.copy()
-        self._failed_alerts_queue.clear()
-
-        for message, validator_name, failed_at in retry_queue:
-            age_seconds = int(time.time() - failed_at)
-            logger.info(f"Retrying failed alert for {validator_name or 'unknown'} (age: {age_seconds}s)")
-
-            # Try to send again
-            telegram_success = self.send_telegram(
-                f"🔴 *CRITICAL* (Retry)\n\n{message}",
-                bypass_rate_limit=True,
-            )
-
-            pushover_success = False
-            if self.pushover_user_key and self.pushover_app_token:
-                pushover_success = self.send_pushover(
-                    message=f"[RETRY] {message}",
-                    title="MONAD CRITICAL ALERT (Retry)",
-                    priority=2,
-                    sound="persistent",
-                    bypass_rate_limit=True,
-                    validator_name=validator_name,
+        retry_queue = self._failed_alerts_queue
+        self._failed_alerts_queue = deque(maxlen=MAX_FAILED_ALERTS_QUEUE_SIZE)
+        pushover_enabled = bool(self.pushover_user_key and self.pushover_app_token)
+
+        for batch in _retry_batches(retry_queue):
+            # One Telegram/Discord/Slack message per batch, posted in the
+            # background while each entry gets its own Pushover page here (in
+            # order, so the per-validator cooldown sees earlier retries)
+            if len(batch) == 1:
+                text = batch[0].message
+            else:
+                text = f"{len(batch)} alerts\n\n" + "\n\n---\n\n".join(
+                    f"• [{entry.validator_name or 'unknown'}] {entry.message}"
+                    for entry in batch
+                )
+            chat_delivered = self._start_all(self._critical_chat_sends(text, retry=True))
+
+            paged = []
+            for message, validator_name, failed_at in batch:
+                age_seconds = int(_now() - failed_at)
+                logger.info(f"Retrying failed alert for {validator_name or 'unknown'} (age: {age_seconds}s)")
+                paged.append(
+                    pushover_enabled
+                    and self._send_pushover_critical(message, validator_name, retry=True)
                 )
 
-            discord_success = self.send_discord(
-                message=f"[RETRY] {message}",
-                title="🔴 MONAD CRITICAL ALERT (Retry)",
-                color=0xe74c3c,  # Red for critical
-                bypass_rate_limit=True,
-            )
-
-            slack_success = self.send_slack(
-                message=f"[RETRY] {message}",
-                title="🔴 MONAD CRITICAL ALERT (Retry)",
-                color="#e74c3c",
-                bypass_rate_limit=True,
-            )
+            delivered = chat_delivered()
+            for entry, pushover_success in zip(batch, paged):
+                validator_name = entry.validator_name
+                if delivered or pushover_success:
+                    sent_count += 1
+                    logger.info(f"Successfully retried alert for {validator_name or 'unknown'}")
+                    continue
 
-            if telegram_success or pushover_success or discord_success or slack_success:
-                sent_count += 1
-                logger.info(f"Successfully retried alert for {validator_name or 'unknown'}")
-            else:
                 # Still failing, re-queue if not too old (max 1 hour)
+                age_seconds = int(_now() - entry.failed_at)
                 if age_seconds < 3600:
-                    self._failed_alerts_queue.append((message, validator_name, failed_at))
+                    self._failed_alerts_queue.append(entry)
                     logger.warning(f"Retry failed for {validator_name or 'unknown'}, re-queued")
                 else:
                     logger.error(f"Dropping stale alert for {validator_name or 'unknown'} (age: {age_seconds}s)")
@@ -1,6 +1,7 @@
 """Configuration loader with environment variable support and validation"""
 
 import os
+import re
 import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
@@ -10,6 +11,16 @@ import yaml
 from monad_monitor.huginn import HuginnConfig
 from monad_monitor.gmonads import GmonadsConfig
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml; pure-Python loader is the fallback
+    from yaml import SafeLoader as _SafeLoader
+
+
+# secp256k1 public key as hex (0x prefix optional). Fewer than 64 hex digits
+# can't identify a validator in the Huginn/gmonads active set lookups
+_SECP_HEX_RE = re.compile(r"(?:0x)?[0-9a-fA-F]{64,}")
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails"""
@@ -18,7 +29,7 @@ class ConfigValidationError(Exception):
 
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidatorConfig:
     """Validator configuration"""
     name: str
@@ -30,27 +41,44 @@ class ValidatorConfig:
     enabled: bool
     network: str = "testnet"  # Network this validator runs on (testnet or mainnet)
 
+    # Endpoint URLs, built once (the config is immutable)
+    _metrics_url: str = field(init=False, repr=False, compare=False)
+    _rpc_url: str = field(init=False, repr=False, compare=False)
+    _node_exporter_url: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_metrics_url", f"http://{self.host}:{self.metrics_port}/metrics")
+        object.__setattr__(self, "_rpc_url", f"http://{self.host}:{self.rpc_port}")
+        object.__setattr__(
+            self,
+            "_node_exporter_url",
+            f"http://{self.host}:{self.node_exporter_port}/metrics" if self.node_exporter_port else None,
+        )
+
     @property
     def metrics_url(self) -> str:
-        return f"http://{self.host}:{self.metrics_port}/metrics"
+        return self._metrics_url
 
     @property
     def rpc_url(self) -> str:
-        return f"http://{self.host}:{self.rpc_port}"
+        return self._rpc_url
 
     @property
     def node_exporter_url(self) -> Optional[str]:
-        if self.node_exporter_port:
-            return f"http://{self.host}:{self.node_exporter_port}/metrics"
-        return None
+        return self._node_exporter_url
+
+
+def _load_yaml(path: str) -> Any:
+    """Read and parse a YAML file (libyaml loader when available)"""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
 
 
 def load_config() -> Dict[str, Any]:
     """Load main configuration file with environment variable substitution"""
     config_path = os.getenv("CONFIG_PATH", "config/config.yaml")
 
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(config_path)
 
     # All alert channels are optional — initialize missing sections
     if "telegram" not in config:
@@ -140,8 +168,7 @@ def load_validators() -> List[ValidatorConfig]:
     """Load validator list from configuration file"""
     validators_path = os.getenv("VALIDATORS_PATH", "config/validators.yaml")
 
-    with open(validators_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(validators_path)
 
     validators = []
     for v in data.get("validators", []):
@@ -182,6 +209,8 @@ def validate_validators(validators: List[ValidatorConfig]) -> None:
             errors.append(f"Validator '{v.name}' has invalid network: '{v.network}' (must be 'testnet' or 'mainnet')")
         if not v.validator_secp:
             errors.append(f"Validator '{v.name}' missing 'validator_secp' - required for active set detection via Huginn/gmonads APIs")
+        elif not _SECP_HEX_RE.fullmatch(v.validator_secp):
+            errors.append(f"Validator '{v.name}' has invalid validator_secp: expected a hex-encoded secp256k1 public key")
         if v.metrics_port and (v.metrics_port < 1 or v.metrics_port > 65535):
             errors.append(f"Validator '{v.name}' has invalid metrics_port: {v.metrics_port}")
         if v.rpc_port and (v.rpc_port < 1 or v.rpc_port > 65535):
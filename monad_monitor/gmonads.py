@@ -1,9 +1,11 @@
 """gmonads.com API client for network-wide metrics and validator status"""
 
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 import requests
 
@@ -173,6 +175,37 @@ def public_keys_match(key1: str, key2: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=1024)
+def _key_lookup_form(key: str) -> Optional[str]:
+    """
+    Normalize a public key to the form used for active-set lookups.
+
+    Uncompressed keys (128/130 hex chars) are reduced to their compressed
+    form from the y parity, without any curve math; anything else is only
+    lowercased and stripped of 0x. Two keys accepted by public_keys_match()
+    share the same lookup form.
+
+    Returns:
+        Lookup form, or None if the key is too short to identify a validator
+    """
+    if not key or len(key) < 64:
+        return None
+
+    k = key.lower()
+    if k.startswith("0x"):
+        k = k[2:]
+    if len(k) == 130 and k.startswith("04"):
+        k = k[2:]
+
+    if len(k) == 128:
+        try:
+            return ("03" if int(k[-1], 16) & 1 else "02") + k[:64]
+        except ValueError:
+            return k
+
+    return k
+
+
 @dataclass
 class GmonadsConfig:
     """Configuration for gmonads API client"""
@@ -291,6 +324,21 @@ class GmonadsClient:
         # Cache for validator metadata (per network)
         self._metadata_cache: Dict[str, Dict] = {}
         self._metadata_cache_times: Dict[str, float] = {}
+        # Active-set lookup tables: network -> (validators list indexed, key form -> set type)
+        self._active_set_index: Dict[str, Tuple[List[EpochValidator], Dict[str, str]]] = {}
+        # Validator checks run concurrently: one lock per (endpoint, network) so a
+        # cold cache is filled by a single request while other callers wait for it
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def _fetch_lock(self, endpoint: str, network: str) -> threading.Lock:
+        """Get or create the lock serializing fetches of one endpoint for a network"""
+        key = (endpoint, network.lower())
+        with self._lock:
+            lock = self._fetch_locks.get(key)
+            if lock is None:
+                lock = self._fetch_locks[key] = threading.Lock()
+            return lock
 
     def get_epoch_validators(self, network: str = "testnet") -> Optional[List[EpochValidator]]:
         """
@@ -302,6 +350,11 @@ class GmonadsClient:
         Returns:
             List of EpochValidator objects, or None on error
         """
+        with self._fetch_lock("validators", network):
+            return self._get_epoch_validators(network)
+
+    def _get_epoch_validators(self, network: str) -> Optional[List[EpochValidator]]:
+        """Serve the epoch validator list from cache or fetch it; caller holds the fetch lock"""
         network_key = network.lower()
         now = time.time()
 
@@ -367,6 +420,11 @@ class GmonadsClient:
         Returns:
             BlockMetrics object, or None on error
         """
+        with self._fetch_lock("metrics", network):
+            return self._get_block_metrics_1m(network)
+
+    def _get_block_metrics_1m(self, network: str) -> Optional[BlockMetrics]:
+        """Serve 1m block metrics from cache or fetch them; caller holds the fetch lock"""
         network_key = network.lower()
         now = time.time()
 
@@ -449,6 +507,11 @@ class GmonadsClient:
         Returns:
             BlockMetricsTrend object, or None on error
         """
+        with self._fetch_lock("trend", network):
+            return self._get_block_metrics_trend(network)
+
+    def _get_block_metrics_trend(self, network: str) -> Optional[BlockMetricsTrend]:
+        """Serve the block metrics trend from cache or fetch it; caller holds the fetch lock"""
         network_key = network.lower()
         now = time.time()
 
@@ -534,6 +597,11 @@ class GmonadsClient:
         Returns:
             Dictionary of validator metadata, or None on error
         """
+        with self._fetch_lock("metadata", network):
+            return self._get_validator_metadata(network)
+
+    def _get_validator_metadata(self, network: str) -> Optional[Dict]:
+        """Serve validator metadata from cache or fetch it; caller holds the fetch lock"""
         network_key = network.lower()
         now = time.time()
 
@@ -582,11 +650,38 @@ class GmonadsClient:
         if validators is None:
             return None
 
+        lookup_form = _key_lookup_form(secp_address)
+        if lookup_form is None:
+            return None
+
+        set_type = self._get_active_set_index(network, validators).get(lookup_form)
+        if set_type is None:
+            return None
+        return set_type == "active"
+
+    def _get_active_set_index(
+        self, network: str, validators: List[EpochValidator]
+    ) -> Dict[str, str]:
+        """
+        Get the key lookup table for a network's epoch validators.
+
+        Built once per fetched validator list and shared by every validator
+        checked against it, instead of matching each key against the whole set.
+        """
+        network_key = network.lower()
+        cached = self._active_set_index.get(network_key)
+        if cached is not None and cached[0] is validators:
+            return cached[1]
+
+        index: Dict[str, str] = {}
         for v in validators:
-            if public_keys_match(secp_address, v.node_id):
-                return v.validator_set_type == "active"
+            lookup_form = _key_lookup_form(v.node_id)
+            if lookup_form is not None:
+                # First entry wins, as with the previous linear scan
+                index.setdefault(lookup_form, v.validator_set_type)
 
-        return None
+        self._active_set_index[network_key] = (validators, index)
+        return index
 
     def get_active_validator_count(self, network: str = "testnet") -> int:
         """
@@ -614,3 +709,4 @@ class GmonadsClient:
         self._trend_cache_times.clear()
         self._metadata_cache.clear()
         self._metadata_cache_times.clear()
+        self._active_set_index.clear()
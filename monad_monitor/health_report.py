@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from .alerts import AlertHandler
 from .config import ValidatorConfig
+from .validator import HealthStatus
 
 
 class HealthReporter:
@@ -27,6 +28,7 @@ class HealthReporter:
         self,
         validators: List[ValidatorConfig],
         states: Dict[str, Dict],
+        latest: Optional[Dict[str, HealthStatus]] = None,
     ) -> bool:
         """
         Send health report if interval has elapsed.
@@ -39,6 +41,7 @@ class HealthReporter:
         Args:
             validators: List of validator configurations
             states: Current validator states
+            latest: Optional last status that carried metrics for each validator
 
         Returns:
             True if report was sent, False otherwise
@@ -49,7 +52,7 @@ class HealthReporter:
             return False
 
         self.last_report_time = current_time
-        self._send_report(validators, states)
+        self._send_report(validators, states, latest)
         return True
 
     def maybe_send_extended_report(
@@ -57,6 +60,7 @@ class HealthReporter:
         validators: List[ValidatorConfig],
         states: Dict[str, Dict],
         metrics_data: Optional[Dict[str, Dict]] = None,
+        latest: Optional[Dict[str, HealthStatus]] = None,
     ) -> bool:
         """
         Send extended health report if interval has elapsed.
@@ -67,6 +71,7 @@ class HealthReporter:
             validators: List of validator configurations
             states: Current validator states
             metrics_data: Optional metrics data for each validator
+            latest: Optional last status that carried metrics for each validator
 
         Returns:
             True if report was sent, False otherwise
@@ -77,13 +82,14 @@ class HealthReporter:
             return False
 
         self.last_extended_report_time = current_time
-        self._send_extended_report(validators, states, metrics_data)
+        self._send_extended_report(validators, states, metrics_data, latest)
         return True
 
     def _send_report(
         self,
         validators: List[ValidatorConfig],
         states: Dict[str, Dict],
+        latest: Optional[Dict[str, HealthStatus]] = None,
     ) -> None:
         """Generate and send health report"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -114,8 +120,9 @@ class HealthReporter:
             report_lines.append(f"   Host: `{validator.host}`")
 
             # Add last known status
-            last_height = state.get("last_height")
-            last_peers = state.get("last_peers")
+            last_known = latest.get(validator.name) if latest else None
+            last_height = last_known.block_height if last_known else None
+            last_peers = last_known.peers if last_known else None
 
             if last_height is not None:
                 report_lines.append(f"   Height: {int(last_height)}")
@@ -153,6 +160,7 @@ class HealthReporter:
         validators: List[ValidatorConfig],
         states: Dict[str, Dict],
         metrics_data: Optional[Dict[str, Dict]] = None,
+        latest: Optional[Dict[str, HealthStatus]] = None,
     ) -> None:
         """Generate and send extended health report with block production metrics"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -181,8 +189,9 @@ class HealthReporter:
             report_lines.append(f"   Host: `{validator.host}`")
 
             # Basic metrics
-            last_height = state.get("last_height")
-            last_peers = state.get("last_peers")
+            last_known = latest.get(validator.name) if latest else None
+            last_height = last_known.block_height if last_known else None
+            last_peers = last_known.peers if last_known else None
 
             if last_height is not None:
                 report_lines.append(f"   Height: {int(last_height)}")
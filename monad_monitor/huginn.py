@@ -4,6 +4,7 @@ Bu modul Huginn Tech API'si ile iletisim kurarak validator uptime bilgilerini sa
 Multi-validator stratejisi ile ag round referansi alir ve circuit breaker ile dayaniklilik saglar.
 """
 
+import threading
 import time
 import logging
 from dataclasses import dataclass, field
@@ -123,41 +124,46 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.last_failure_time: Optional[float] = None
         self._logger = logging.getLogger(__name__)
+        # Checks for several validators on one network share this breaker
+        self._lock = threading.Lock()
 
     def can_execute(self) -> bool:
         """Check if request can be executed"""
-        if self.state == CircuitState.CLOSED:
-            return True
-
-        if self.state == CircuitState.OPEN:
-            # Check if recovery time has passed
-            if self.last_failure_time and (time.time() - self.last_failure_time >= self.recovery_time):
-                self.state = CircuitState.HALF_OPEN
-                self._logger.info("Circuit breaker: OPEN -> HALF_OPEN, testing recovery")
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
                 return True
-            return False
 
-        # HALF_OPEN - allow one request to test
-        return True
+            if self.state == CircuitState.OPEN:
+                # Check if recovery time has passed
+                if self.last_failure_time and (time.time() - self.last_failure_time >= self.recovery_time):
+                    self.state = CircuitState.HALF_OPEN
+                    self._logger.info("Circuit breaker: OPEN -> HALF_OPEN, testing recovery")
+                    return True
+                return False
+
+            # HALF_OPEN - allow one request to test
+            return True
 
     def record_success(self) -> None:
         """Record successful request"""
-        if self.state == CircuitState.HALF_OPEN:
-            self._logger.info("Circuit breaker: HALF_OPEN -> CLOSED, recovered")
-        self.failure_count = 0
-        self.state = CircuitState.CLOSED
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                self._logger.info("Circuit breaker: HALF_OPEN -> CLOSED, recovered")
+            self.failure_count = 0
+            self.state = CircuitState.CLOSED
 
     def record_failure(self) -> None:
         """Record failed request"""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.time()
 
-        if self.failure_count >= self.failure_threshold:
-            if self.state != CircuitState.OPEN:
-                self._logger.warning(
-                    f"Circuit breaker: {self.state.name} -> OPEN after {self.failure_count} failures"
-                )
-            self.state = CircuitState.OPEN
+            if self.failure_count >= self.failure_threshold:
+                if self.state != CircuitState.OPEN:
+                    self._logger.warning(
+                        f"Circuit breaker: {self.state.name} -> OPEN after {self.failure_count} failures"
+                    )
+                self.state = CircuitState.OPEN
 
     def is_open(self) -> bool:
         """Check if circuit is open (failing fast)"""
@@ -191,15 +197,29 @@ class HuginnClient:
         self._cache_times: Dict[str, float] = {}
         # Circuit breaker for each network
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        # Validator checks run concurrently: guards the breaker and fetch-lock tables
+        self._lock = threading.Lock()
+        # One lock per cache key, so concurrent callers share a single fetch
+        self._fetch_locks: Dict[str, threading.Lock] = {}
         # Logger
         self._logger = logging.getLogger(__name__)
 
     def _get_circuit_breaker(self, network: str) -> CircuitBreaker:
         """Get or create circuit breaker for network"""
         network_key = network.lower()
-        if network_key not in self._circuit_breakers:
-            self._circuit_breakers[network_key] = CircuitBreaker()
-        return self._circuit_breakers[network_key]
+        with self._lock:
+            breaker = self._circuit_breakers.get(network_key)
+            if breaker is None:
+                breaker = self._circuit_breakers[network_key] = CircuitBreaker()
+            return breaker
+
+    def _fetch_lock(self, cache_key: str) -> threading.Lock:
+        """Get or create the lock serializing fetches for one cache key"""
+        with self._lock:
+            lock = self._fetch_locks.get(cache_key)
+            if lock is None:
+                lock = self._fetch_locks[cache_key] = threading.Lock()
+            return lock
 
     def _fetch_with_retry(
         self,
@@ -293,9 +313,18 @@ class HuginnClient:
         if not secp_address:
             return None
 
+        cache_key = f"{network.lower()}:{secp_address.lower()}"
+
+        # A caller arriving while another fetches this key waits, then hits the cache
+        with self._fetch_lock(cache_key):
+            return self._get_validator_uptime(secp_address, network, cache_key)
+
+    def _get_validator_uptime(
+        self, secp_address: str, network: str, cache_key: str
+    ) -> Optional[ValidatorUptime]:
+        """Serve uptime from cache or fetch it; caller holds the key's fetch lock"""
         # Check cache validity - use network-prefixed cache key
         now = time.time()
-        cache_key = f"{network.lower()}:{secp_address.lower()}"
 
         if cache_key in self._cache:
             cached_time = self._cache_times.get(cache_key, 0)
@@ -1,31 +1,267 @@
 """Logging configuration for Monad Validator Monitor"""
 
+import atexit
+import collections.abc
 import io
 import logging
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+# Console output is buffered and flushed once this many bytes are pending
+LOG_BUFFER_BYTES = int(os.getenv("LOG_BUFFER_BYTES", str(64 * 1024)))
+
+# Maximum age (seconds) of buffered console output before it is flushed
+LOG_FLUSH_INTERVAL = 1.0
+
+
+class FastLogRecord(logging.LogRecord):
+    """LogRecord that skips source, thread and process introspection
+
+    setup_logger() turns off logging._srcfile and the thread/process flags,
+    so those attributes are constant; they are assigned directly here
+    instead of going through LogRecord.__init__'s path and thread lookups.
+    """
+
+    def __init__(self, name, level, pathname, lineno, msg, args, exc_info,
+                 func=None, sinfo=None, **kwargs):
+        ct = time.time()
+        self.name = name
+        self.msg = msg
+        if (args and len(args) == 1 and isinstance(args[0], collections.abc.Mapping)
+                and args[0]):
+            args = args[0]
+        self.args = args
+        self.levelname = logging.getLevelName(level)
+        self.levelno = level
+        self.pathname = pathname
+        self.filename = pathname
+        self.module = pathname
+        self.exc_info = exc_info
+        self.exc_text = None
+        self.stack_info = sinfo
+        self.lineno = lineno
+        self.funcName = func
+        self.created = ct
+        self.msecs = int((ct - int(ct)) * 1000) + 0.0
+        self.relativeCreated = (ct - logging._startTime) * 1000
+        self.thread = None
+        self.threadName = None
+        self.processName = None
+        self.process = None
+        self.taskName = None
+
+
+class FastLogger(logging.Logger):
+    """Logger that creates FastLogRecord instances"""
+
+    def makeRecord(self, name, level, fn, lno, msg, args, exc_info,
+                   func=None, extra=None, sinfo=None):
+        rv = FastLogRecord(name, level, fn, lno, msg, args, exc_info, func, sinfo)
+        if extra is not None:
+            for key in extra:
+                if key in ("message", "asctime") or key in rv.__dict__:
+                    raise KeyError(f"Attempt to overwrite {key!r} in LogRecord")
+                rv.__dict__[key] = extra[key]
+        return rv
+
+
+class LogQueueListener(QueueListener):
+    """QueueListener that also services flush requests sent through the queue
+
+    flush() enqueues a threading.Event and waits (up to timeout) for the
+    listener thread to reach it, so every record logged before the call
+    has been handled and the handlers' buffers have been written out.
+    """
+
+    def flush(self, timeout: float = 1.0) -> None:
+        """Handle all queued records and flush the handlers"""
+        if self._thread is None:
+            for handler in self.handlers:
+                handler.flush()
+            return
+        done = threading.Event()
+        self.queue.put_nowait(done)
+        done.wait(timeout)
+
+    def handle(self, record):
+        if isinstance(record, threading.Event):
+            for handler in self.handlers:
+                handler.flush()
+            record.set()
+            return
+        super().handle(record)
 
 
 class SafeStreamHandler(logging.StreamHandler):
-    """StreamHandler that safely handles Unicode on Windows"""
+    """StreamHandler that safely handles Unicode on Windows
+
+    Encoded records are collected in an in-memory buffer and written to the
+    underlying byte stream in one write + flush when the buffer reaches
+    buffer_size bytes or LOG_FLUSH_INTERVAL seconds have passed, instead of
+    one write + flush syscall pair per record. Call flush() to drain pending
+    output (done by flush_logs() and on logging shutdown).
+    """
+
+    def __init__(self, stream=None, buffer_size: int = LOG_BUFFER_BYTES):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self._terminator_bytes = self.terminator.encode('utf-8')
+        self._pending = bytearray()
+        self._last_flush = time.monotonic()
 
     def emit(self, record):
         try:
-            msg = self.format(record)
             stream = self.stream
             # Ensure UTF-8 encoding for output
             if hasattr(stream, 'buffer'):
-                stream.buffer.write((msg + self.terminator).encode('utf-8', errors='replace'))
-                stream.buffer.flush()
+                formatter = self.formatter
+                if isinstance(formatter, FastFormatter):
+                    self._pending += formatter.formatBytes(record)
+                else:
+                    self._pending += self.format(record).encode('utf-8', errors='replace')
+                self._pending += self._terminator_bytes
+                if (len(self._pending) >= self.buffer_size
+                        or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL):
+                    self._flush_pending()
             else:
-                stream.write(msg + self.terminator)
+                stream.write(self.format(record) + self.terminator)
                 stream.flush()
         except Exception:
             self.handleError(record)
 
+    def flush(self):
+        """Write out any buffered records and flush the stream"""
+        self.acquire()
+        try:
+            if self._pending:
+                self._flush_pending()
+            elif self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def _flush_pending(self) -> None:
+        """Write buffered bytes to the stream (caller must hold the handler lock)"""
+        if self._pending:
+            buffer = self.stream.buffer
+            buffer.write(bytes(self._pending))
+            buffer.flush()
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+
+class BufferedFileHandler(logging.Handler):
+    """File handler that buffers writes instead of flushing every record
+
+    Records go through a BufferedWriter of buffer_size bytes, which writes
+    to disk when full. It is also flushed on WARNING+ records and once
+    LOG_FLUSH_INTERVAL seconds have passed since the last flush, so problems
+    reach the file promptly. logging.shutdown() flushes it at exit.
+    """
+
+    terminator = '\n'
+
+    def __init__(self, filename: str, encoding: str = 'utf-8', buffer_size: int = LOG_BUFFER_BYTES):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self._terminator_bytes = self.terminator.encode(encoding)
+        self._writer = open(self.baseFilename, 'ab', buffering=buffer_size)
+        self._last_flush = time.monotonic()
 
-class ColoredFormatter(logging.Formatter):
+    def emit(self, record):
+        try:
+            if self._writer is None:
+                return
+            msg = self.format(record)
+            self._writer.write(msg.encode(self.encoding, errors='replace'))
+            self._writer.write(self._terminator_bytes)
+            if (record.levelno >= logging.WARNING
+                    or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL):
+                self._writer.flush()
+                self._last_flush = time.monotonic()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Write any buffered records to the file"""
+        self.acquire()
+        try:
+            if self._writer is not None:
+                self._writer.flush()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def close(self):
+        """Flush and close the underlying file"""
+        self.acquire()
+        try:
+            if self._writer is not None:
+                try:
+                    self._writer.flush()
+                finally:
+                    self._writer.close()
+                    self._writer = None
+        finally:
+            self.release()
+        super().close()
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter specialised for the "[asctime] LEVEL [name: ]message" layout
+
+    Builds each line with a single str.join instead of logging.Formatter's
+    generic %-style substitution over the record's __dict__. Exception and
+    stack info are appended the same way logging.Formatter does.
+    """
+
+    def __init__(self, datefmt: str = '%H:%M:%S', show_name: bool = False):
+        fmt = '[%(asctime)s] %(levelname)s %(name)s: %(message)s' if show_name \
+            else '[%(asctime)s] %(levelname)s %(message)s'
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self.show_name = show_name
+        # (epoch second, formatted asctime) of the last record; datefmt has
+        # one-second resolution, so records within the same second reuse it
+        self._asctime_cache = (-1, "")
+
+    def format(self, record):
+        record.message = record.getMessage()
+        second = int(record.created)
+        cached_second, asctime = self._asctime_cache
+        if second != cached_second:
+            asctime = time.strftime(self.datefmt, time.localtime(second))
+            self._asctime_cache = (second, asctime)
+        record.asctime = asctime
+        if self.show_name:
+            s = "".join(("[", record.asctime, "] ", record.levelname, " ", record.name, ": ", record.message))
+        else:
+            s = "".join(("[", record.asctime, "] ", record.levelname, " ", record.message))
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+        return s
+
+    def formatBytes(self, record) -> bytes:
+        """Format record as UTF-8 bytes (without terminator) for byte-stream handlers"""
+        return self.format(record).encode('utf-8', errors='replace')
+
+
+class ColoredFormatter(FastFormatter):
     """Custom formatter with colors for different log levels"""
 
     # ANSI color codes
@@ -38,16 +274,38 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precomputed (prefix, suffix) pair per level, joined with the message in one pass.
+        # Keyed by numeric level so lookups hash an int rather than the levelname string.
+        self._level_affixes = {
+            logging.getLevelName(level): (color, self.RESET)
+            for level, color in self.COLORS.items()
+        }
+        # Same affixes pre-encoded, so formatBytes() only encodes the message itself
+        self._level_affix_bytes = {
+            levelno: (prefix.encode('ascii'), suffix.encode('ascii'))
+            for levelno, (prefix, suffix) in self._level_affixes.items()
+        }
+
     def format(self, record):
         # Get base formatted message
         formatted = super().format(record)
 
         # Add color based on level
-        color = self.COLORS.get(record.levelname, '')
-        if color:
-            formatted = f"{color}{formatted}{self.RESET}"
+        affixes = self._level_affixes.get(record.levelno)
+        if affixes is None:
+            return formatted
 
-        return formatted
+        return "".join((affixes[0], formatted, affixes[1]))
+
+    def formatBytes(self, record) -> bytes:
+        body = super().format(record).encode('utf-8', errors='replace')
+        affixes = self._level_affix_bytes.get(record.levelno)
+        if affixes is None:
+            return body
+
+        return b"".join((affixes[0], body, affixes[1]))
 
 
 def setup_logger(
@@ -66,10 +324,22 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    # None of our formats use caller, thread or process fields; skip collecting
+    # them (sys._getframe walk in findCaller, thread/process lookups) per record
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Loggers created from here on (ours included) build FastLogRecord instances
+    logging.setLoggerClass(FastLogger)
+
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
-    # Clear existing handlers
+    # Clear existing handlers (draining any queued and buffered output first)
+    _stop_listener(name)
+    for handler in logger.handlers:
+        handler.flush()
     logger.handlers.clear()
 
     # Console handler with safe Unicode handling
@@ -77,62 +347,112 @@ def setup_logger(
     console_handler.setLevel(logging.DEBUG)
 
     # Format: [HH:MM:SS] LEVEL Message
-    formatter = ColoredFormatter(
-        fmt='[%(asctime)s] %(levelname)s %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    formatter = ColoredFormatter(datefmt='%H:%M:%S')
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # Optional file handler
     if log_file:
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            fmt='[%(asctime)s] %(levelname)s %(name)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        file_formatter = FastFormatter(datefmt='%Y-%m-%d %H:%M:%S', show_name=True)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Formatting and I/O run on a background listener thread; the logger itself
+    # only gets a QueueHandler, so a logging call costs a queue put
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = LogQueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _listeners[name] = (listener, queue_handler)
 
     return logger
 
 
-# Global logger instance
-_logger: Optional[logging.Logger] = None
+# Running queue listeners keyed by logger name, with the QueueHandler feeding each
+_listeners: Dict[str, Tuple[LogQueueListener, QueueHandler]] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Stop the queue listener of a logger and attach its handlers directly.
+
+    Queued records are handled before the listener thread exits. Anything
+    logged afterwards is written synchronously instead of piling up in a
+    queue nobody reads.
+    """
+    entry = _listeners.pop(name, None)
+    if entry is None:
+        return
+    listener, queue_handler = entry
+    listener.stop()
+    logger = logging.getLogger(name)
+    logger.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            # Stream already closed (e.g. during interpreter teardown), as in logging.shutdown()
+            pass
+        logger.addHandler(handler)
+
+
+def shutdown_logging() -> None:
+    """Stop all queue listeners, writing out every pending record"""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(shutdown_logging)
+
+
+# Global logger instance, configured with defaults at import. init_logger()
+# reconfigures the same Logger object (loggers are unique per name), so
+# references taken from it - including the convenience functions below -
+# stay valid after reconfiguration.
+_logger: logging.Logger = setup_logger()
+
+# Whether the global logger emits DEBUG records (refreshed by init_logger)
+_debug_enabled = _logger.isEnabledFor(logging.DEBUG)
 
 
 def get_logger() -> logging.Logger:
-    """Get or create the global logger instance"""
-    global _logger
-    if _logger is None:
-        _logger = setup_logger()
+    """Get the global logger instance"""
     return _logger
 
 
 def init_logger(level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """Initialize the global logger with custom settings"""
-    global _logger
+    global _logger, _debug_enabled
     _logger = setup_logger(level=level, log_file=log_file)
+    _debug_enabled = _logger.isEnabledFor(logging.DEBUG)
     return _logger
 
 
-# Convenience functions
-def debug(msg: str):
-    get_logger().debug(msg)
-
+def is_debug_enabled() -> bool:
+    """Check if DEBUG output is enabled on the global logger.
 
-def info(msg: str):
-    get_logger().info(msg)
-
-
-def warning(msg: str):
-    get_logger().warning(msg)
+    Use this to guard debug() calls whose message is expensive to build
+    (e.g. multi-field f-strings in the per-validator loop) so the string
+    is only formatted when it will actually be logged.
+    """
+    return _debug_enabled
 
 
-def error(msg: str):
-    get_logger().error(msg)
+def flush_logs() -> None:
+    """Flush all records logged so far through the global logger's handlers"""
+    entry = _listeners.get(_logger.name)
+    if entry is not None:
+        entry[0].flush()
+    for handler in _logger.handlers:
+        handler.flush()
 
 
-def critical(msg: str):
-    get_logger().critical(msg)
+# Convenience functions (bound methods of the global logger; Logger's own
+# level check makes debug() return early when DEBUG is disabled)
+debug = _logger.debug
+info = _logger.info
+warning = _logger.warning
+error = _logger.error
+critical = _logger.critical
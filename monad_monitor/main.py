@@ -1,9 +1,11 @@
 """Monad Validator Monitor - Main Entry Point"""
 
+import re
 import signal
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 from .alerts import AlertHandler
@@ -22,18 +24,25 @@ from .gmonads import GmonadsClient
 from .health_report import HealthReporter
 from .health_server import HealthServer
 from .huginn import HuginnClient
-from .logger import init_logger, get_logger, debug, info, warning, error
-from .state_machine import ValidatorStateMachine, ValidatorState
-from .validator import ValidatorHealthChecker, SystemThresholds
+from .logger import init_logger, get_logger, flush_logs, shutdown_logging, is_debug_enabled, debug, info, warning, error
+from .metrics import SystemMetricsCache
+from .state_machine import StatePersistenceService, ValidatorStateMachine, ValidatorState
+from .validator import HealthStatus, ValidatorHealthChecker, SystemThresholds
 from .api_server import APIServer
 
 # Constants
 MAX_METRICS_HISTORY = 100  # Maximum entries per validator to prevent unbounded growth
-STATE_FILE = "validator_state.json"  # State persistence file
+STATE_FILE = "validator_state.json"  # Aggregated state persistence file (all validators)
+TRANSITION_LOG_FILE = "validator_transitions.jsonl"  # Append-only state transition history
 STATE_DIR = "/app/state"  # Directory for state persistence (Docker volume mount point)
+MAX_CHECK_WORKERS = 32  # Maximum validators health-checked concurrently (one tick ~ one round-trip)
+
+# Characters in validator names replaced with "_" when building state filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[ /\\]")
 
 # Global state for graceful shutdown
 running = True
+_shutdown_event = threading.Event()  # Set by signal_handler to wake any pending wait
 health_server: Optional[HealthServer] = None
 dashboard_server: Optional[DashboardServer] = None
 
@@ -41,7 +50,9 @@ def signal_handler(sig, frame):
     """Handle shutdown signals gracefully"""
     global running
     info("Shutdown signal received...")
+    flush_logs()
     running = False
+    _shutdown_event.set()
 
 
 def main():
@@ -196,7 +207,22 @@ def main():
     # State tracking for each validator
     states: Dict[str, Dict] = {}
     state_machines: Dict[str, ValidatorStateMachine] = {}
-    health_checkers: Dict[str, ValidatorHealthChecker] = {}
+
+    # Validators sharing a host share one node exporter scrape per cycle
+    system_metrics_cache = SystemMetricsCache()
+
+    # One health checker per validator, re-used across cycles (rate-based CPU calculation)
+    health_checkers: Dict[str, ValidatorHealthChecker] = {
+        v.name: ValidatorHealthChecker(
+            validator=v,
+            timeout=config["monitoring"].get("timeout", 10),
+            thresholds=thresholds,
+            huginn_client=huginn_client,
+            gmonads_client=gmonads_client,
+            system_metrics_cache=system_metrics_cache,
+        )
+        for v in validators
+    }
 
     # Ensure state directory exists (for Docker volume persistence)
     import os
@@ -209,14 +235,21 @@ def main():
             warning(f"Failed to create state directory {state_dir}: {e}. Using current directory.")
             state_dir = "."
 
+    # Aggregated state file for all validators, plus the legacy per-validator
+    # state files (name sanitized once) that are still read for migration
+    state_file = os.path.join(state_dir, STATE_FILE)
+    state_file_paths: Dict[str, str] = {
+        v.name: os.path.join(state_dir, f"state_{_UNSAFE_FILENAME_CHARS.sub('_', v.name)}.json")
+        for v in validators
+    }
+    persisted_machines = ValidatorStateMachine.load_all(state_file)
+
     # Load persisted state for each validator
     for v in validators:
         states[v.name] = {
             "fails": 0,
             "alert_active": False,
             "last_commits": None,
-            "last_height": None,
-            "last_peers": None,
             "warning_counts": {},  # Track warning occurrences
             "critical_counts": {},  # Track critical resource occurrences
             "last_execution_lagging": None,  # Track execution lagging for increase detection
@@ -225,10 +258,9 @@ def main():
             "ts_alert_active": False,  # Whether ts_validation_fail alert is currently active
             "last_huginn_timeout_count": None,  # Track Huginn timeout count (network-visible timeouts)
         }
-        # Sanitize validator name for filename (replace spaces and special chars)
-        safe_name = v.name.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        state_file = os.path.join(state_dir, f"state_{safe_name}.json")
-        loaded_machine = ValidatorStateMachine.load_state(state_file)
+        loaded_machine = persisted_machines.get(v.name)
+        if loaded_machine is None:
+            loaded_machine = ValidatorStateMachine.load_state(state_file_paths[v.name])
         if loaded_machine.validator_name == v.name:
             state_machines[v.name] = loaded_machine
             info(f"Loaded persisted state for {v.name}: {loaded_machine.current_state.value}")
@@ -237,20 +269,67 @@ def main():
             state_machines[v.name] = ValidatorStateMachine(validator_name=v.name)
             debug(f"Created new state machine for {v.name}")
 
+    # State changes are written to the aggregated file in the background, and
+    # each transition is appended to the transition history log
+    state_persistence = StatePersistenceService(
+        state_file,
+        state_machines.values(),
+        transition_log_path=os.path.join(state_dir, TRANSITION_LOG_FILE),
+    )
+
     # Metrics data for extended reports
     metrics_data: Dict[str, Dict] = {}
 
+    # Last health status that carried metrics, per validator; refreshed only on
+    # success so failed checks and reports can show the last known height/peers
+    latest: Dict[str, HealthStatus] = {}
+
+    # Validator set is fixed for the lifetime of the process (config is loaded once)
+    configured_names = frozenset(v.name for v in validators)
+
     # Send startup notification
     health_reporter.send_startup_report(validators)
     info(f"Monitor started - {len(validators)} validators | Log level: {log_level}")
 
+    # Thread pool for concurrent per-validator health checks (I/O bound)
+    check_executor = ThreadPoolExecutor(
+        max_workers=min(MAX_CHECK_WORKERS, len(validators)),
+        thread_name_prefix="health-check",
+    )
+
     # Main monitoring loop
     try:
         while running:
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            cycle_start = time.time()  # Shared "last_check" timestamp for this cycle
             all_healthy = True
+            # Published to the health/dashboard servers, whose threads serialize it:
+            # built fresh every cycle and never modified once handed over
             health_server_validators: Dict[str, Dict[str, Any]] = {}
 
+            # Run the network-bound health checks concurrently; the results are
+            # processed one validator at a time below since that mutates shared state
+            check_futures = {
+                validator.name: check_executor.submit(
+                    health_checkers[validator.name].check,
+                    states[validator.name]["last_commits"],
+                    states[validator.name].get("last_execution_lagging"),
+                    states[validator.name].get("last_ts_validation_fail"),
+                )
+                for validator in validators
+            }
+
+            # Fetch per-network TPS from gmonads while the checks run
+            network_tps: Dict[str, float] = {}
+            if gmonads_client:
+                networks_seen = {v.network for v in validators if v.network}
+                for net in networks_seen:
+                    try:
+                        block_metrics = gmonads_client.get_block_metrics_1m(network=net)
+                        if block_metrics is not None:
+                            network_tps[net] = block_metrics.avg_tps
+                    except Exception as e:
+                        debug(f"Failed to fetch TPS for {net}: {e}")
+
             for validator in validators:
                 if not running:
                     break
@@ -258,31 +337,17 @@ def main():
                 state = states[validator.name]
                 state_machine = state_machines[validator.name]
 
-                # Get or create health checker (re-use for rate-based CPU calculation)
-                if validator.name not in health_checkers:
-                    health_checkers[validator.name] = ValidatorHealthChecker(
-                        validator=validator,
-                        timeout=config["monitoring"].get("timeout", 10),
-                        thresholds=thresholds,
-                        huginn_client=huginn_client,
-                        gmonads_client=gmonads_client,
-                    )
-                checker = health_checkers[validator.name]
-
-                # Perform health check
-                health_status, current_commits, current_execution_lagging, current_ts_validation_fail, ts_fail_increasing = checker.check(
-                    state["last_commits"],
-                    state.get("last_execution_lagging"),
-                    state.get("last_ts_validation_fail"),
+                # Collect health check result
+                health_status, current_commits, current_execution_lagging, current_ts_validation_fail, ts_fail_increasing = (
+                    check_futures[validator.name].result()
                 )
                 state["last_commits"] = current_commits
                 state["last_execution_lagging"] = current_execution_lagging
                 state["last_ts_validation_fail"] = current_ts_validation_fail
 
-                # Update state with latest metrics
+                # Remember the latest status that carried metrics
                 if health_status.metrics:
-                    state["last_height"] = health_status.block_height
-                    state["last_peers"] = health_status.peers
+                    latest[validator.name] = health_status
 
                     # Store metrics for extended reports
                     metrics_data[validator.name] = {
@@ -295,7 +360,7 @@ def main():
                     }
 
                     # Log Huginn API data if available (DEBUG level)
-                    if health_status.huginn_data:
+                    if health_status.huginn_data and is_debug_enabled():
                         h = health_status.huginn_data
                         debug(
                             f"Huginn [{validator.name}]: is_active={h.get('is_active')}, "
@@ -319,6 +384,7 @@ def main():
                             state_machine.current_state = ValidatorState.INACTIVE
                         state_machine._state_entered_at = time.time()
                         debug(f"Initialized state machine for {validator.name} as {state_machine.current_state.value}")
+                        state_persistence.submit(state_machine)
                         transition = None
                     else:
                         # If we don't have Huginn data, infer is_ever_active from current state
@@ -330,6 +396,8 @@ def main():
                             is_ever_active=is_ever_active,
                             metadata={}
                         )
+                        if transition:
+                            state_persistence.submit(state_machine, transition)
 
                     # Handle state transitions with alerts (Telegram + Discord)
                     if transition and transition.is_significant():
@@ -362,30 +430,15 @@ def main():
                         # Huginn unavailable - no local_timeout fallback
                         # local_timeout metric tracks OTHER nodes' timeouts, not our validator's status
                         # We rely on gmonads fallback (already implemented) and local health metrics
-                        debug(f"Huginn unavailable for {validator.name}, relying on gmonads and local metrics")
-
-                # Update health server validator data
-                health_server_validators[validator.name] = {
-                    "state": state_machine.current_state.value,
-                    "healthy": health_status.is_healthy,
-                    "height": state.get("last_height"),
-                    "peers": state.get("last_peers"),
-                    "fails": state["fails"],
-                    "huginn_data": health_status.huginn_data,
-                    "last_check": time.time(),  # Timestamp for last check
-                    "network": validator.network,  # Per-validator network
-                    "system_metrics": None,
-                    "block_production": None,
-                    "warnings": health_status.warnings or [],
-                    "criticals": health_status.criticals or [],
-                    "rpc_healthy": health_status.rpc_healthy if health_status.rpc_healthy is not None else True,
-                }
+                        if is_debug_enabled():
+                            debug(f"Huginn unavailable for {validator.name}, relying on gmonads and local metrics")
 
                 # Flatten system metrics into dashboard-friendly format
+                system_metrics = None
                 if health_status.system_metrics:
                     sm = health_status.system_metrics
                     triedb_data = sm.get("triedb", {})
-                    health_server_validators[validator.name]["system_metrics"] = {
+                    system_metrics = {
                         "cpu_used_percent": sm.get("cpu_used_percent"),
                         "mem_percent": sm.get("mem_percent"),
                         "disk_percent": sm.get("disk_percent"),
@@ -393,53 +446,73 @@ def main():
                     }
 
                 # Add block production metrics
+                block_production = None
                 if health_status.metrics:
-                    health_server_validators[validator.name]["block_production"] = {
+                    block_production = {
                         "proposals": health_status.metrics.get("proposals"),
                         "block_commits": health_status.metrics.get("block_commits"),
                         "local_timeout": health_status.metrics.get("local_timeout"),
                     }
 
+                # Update health server validator data
+                last_known = latest.get(validator.name)
+                health_server_validators[validator.name] = {
+                    "state": state_machine.current_state.value,
+                    "healthy": health_status.is_healthy,
+                    "height": last_known.block_height if last_known else None,
+                    "peers": last_known.peers if last_known else None,
+                    "fails": state["fails"],
+                    "huginn_data": health_status.huginn_data,
+                    "last_check": cycle_start,  # Timestamp for last check
+                    "network": validator.network,  # Per-validator network
+                    "system_metrics": system_metrics,
+                    "block_production": block_production,
+                    "warnings": health_status.warnings or [],
+                    "criticals": health_status.criticals or [],
+                    "rpc_healthy": health_status.rpc_healthy if health_status.rpc_healthy is not None else True,
+                    "network_tps": network_tps.get(validator.network),
+                }
+
                 # Handle warnings (non-critical alerts)
+                # Counters are keyed by message category rather than a fixed enum:
+                # NVMe warnings are per-device, so the key set is not known up front
+                warning_counts = state["warning_counts"]
                 if health_status.warnings:
                     for warn_msg in health_status.warnings:
                         # Track warning occurrences
-                        warning_key = warn_msg.split(":")[0]  # e.g., "CPU", "Memory", "Disk"
-                        state["warning_counts"][warning_key] = state["warning_counts"].get(warning_key, 0) + 1
+                        warning_key = warn_msg.partition(":")[0]  # e.g., "CPU warning", "Memory warning"
+                        count = warning_counts.get(warning_key, 0) + 1
 
                         # Send warning alert after 3 consecutive occurrences
-                        if state["warning_counts"][warning_key] == 3:
+                        if count == 3:
                             alerts.alert_warning(f"*{validator.name}*\n\n{warn_msg}")
-                            state["warning_counts"][warning_key] = -10  # Cooldown to prevent spam
+                            count = -10  # Cooldown to prevent spam
+                        warning_counts[warning_key] = count
                 else:
                     # Reset warning counts on healthy check
-                    for key in list(state["warning_counts"].keys()):
-                        if state["warning_counts"][key] < 0:
-                            state["warning_counts"][key] += 1
-                        else:
-                            state["warning_counts"][key] = 0
+                    for key, count in warning_counts.items():
+                        warning_counts[key] = count + 1 if count < 0 else 0
 
                 # Handle critical resource alerts (Telegram + Pushover + Discord)
+                critical_counts = state["critical_counts"]
                 if health_status.criticals:
                     for critical_msg in health_status.criticals:
                         # Track critical occurrences
-                        critical_key = critical_msg.split(":")[0]  # e.g., "CPU", "Memory", "Disk"
-                        state["critical_counts"][critical_key] = state["critical_counts"].get(critical_key, 0) + 1
+                        critical_key = critical_msg.partition(":")[0]  # e.g., "CPU critical", "Disk critical"
+                        count = critical_counts.get(critical_key, 0) + 1
 
                         # Send critical alert after 2 consecutive occurrences (faster than warnings)
-                        if state["critical_counts"][critical_key] == 2:
+                        if count == 2:
                             alerts.alert_critical(
                                 f"*{validator.name}*\n\n{critical_msg}",
                                 validator_name=validator.name
                             )
-                            state["critical_counts"][critical_key] = -10  # Cooldown to prevent spam
+                            count = -10  # Cooldown to prevent spam
+                        critical_counts[critical_key] = count
                 else:
                     # Reset critical counts on healthy check
-                    for key in list(state["critical_counts"].keys()):
-                        if state["critical_counts"][key] < 0:
-                            state["critical_counts"][key] += 1
-                        else:
-                            state["critical_counts"][key] = 0
+                    for key, count in critical_counts.items():
+                        critical_counts[key] = count + 1 if count < 0 else 0
 
                 if health_status.is_healthy:
                     state["fails"] = 0
@@ -478,13 +551,15 @@ def main():
                         state["alert_active"] = False
 
                     # Log healthy status (INFO level - concise format)
+                    # A healthy status always carries metrics, so read height/peers from it
                     # Format height with thousand separators
-                    height_formatted = f"{state.get('last_height'):,}" if state.get('last_height') else "N/A"
-                    peers_formatted = state.get('last_peers', 'N/A')
+                    block_height = health_status.block_height
+                    height_formatted = f"{block_height:,}" if block_height else "N/A"
+                    peers_formatted = health_status.peers
                     info(f"✅ {validator.name}: In-sync · Height: {height_formatted} · Peers: {peers_formatted}")
 
                     # Log detailed Huginn data at DEBUG level
-                    if health_status.huginn_data:
+                    if health_status.huginn_data and is_debug_enabled():
                         h = health_status.huginn_data
                         debug(
                             f"Huginn [{validator.name}]: "
@@ -510,28 +585,10 @@ def main():
                         else:
                             error(f"Failed to send CRITICAL alert for {validator.name} - will retry next cycle")
 
-                # Brief pause between validator checks
-                time.sleep(1)
-
             # Update health server with overall status
             if health_server:
                 health_server.update_status(is_healthy=all_healthy, validators=health_server_validators)
 
-            # Fetch per-network TPS from gmonads and attach to each validator
-            if gmonads_client:
-                networks_seen = {v.network for v in validators if v.network}
-                network_tps = {}
-                for net in networks_seen:
-                    try:
-                        block_metrics = gmonads_client.get_block_metrics_1m(network=net)
-                        if block_metrics is not None:
-                            network_tps[net] = block_metrics.avg_tps
-                    except Exception as e:
-                        debug(f"Failed to fetch TPS for {net}: {e}")
-                # Attach TPS to each validator based on their network
-                for vname, vdata in health_server_validators.items():
-                    vdata["network_tps"] = network_tps.get(vdata.get("network"))
-
             # Update dashboard server with validator data
             if dashboard_server:
                 health_status_obj = health_server.get_health_status() if health_server else None
@@ -542,14 +599,13 @@ def main():
                 )
 
             # Check if it's time for extended health report (6-hour detailed report)
-            health_reporter.maybe_send_extended_report(validators, states, metrics_data)
+            health_reporter.maybe_send_extended_report(validators, states, metrics_data, latest)
 
             # Memory cleanup: Remove stale entries from metrics_data
             # (validators that were removed from config)
-            configured_names = {v.name for v in validators}
-            stale_names = set(metrics_data.keys()) - configured_names
-            for stale_name in stale_names:
+            for stale_name in [name for name in metrics_data if name not in configured_names]:
                 del metrics_data[stale_name]
+                latest.pop(stale_name, None)
                 debug(f"Removed stale metrics entry for: {stale_name}")
 
             # Retry any failed critical alerts
@@ -557,28 +613,28 @@ def main():
             if retried > 0:
                 info(f"Retried {retried} failed alert(s)")
 
-            # Wait for next cycle with interruptible sleep
-            # This allows quick response to SIGTERM by checking running flag every second
+            # Wait for next cycle; signal_handler sets _shutdown_event so SIGTERM
+            # wakes the wait immediately instead of polling the running flag
+            # Buffered log output is flushed before idling so the cycle's logs are visible
+            flush_logs()
             if running:
-                sleep_interval = config["monitoring"].get("check_interval", 60)
-                slept = 0
-                while running and slept < sleep_interval:
-                    time.sleep(1)
-                    slept += 1
+                _shutdown_event.wait(config["monitoring"].get("check_interval", 60))
 
     finally:
         # Graceful shutdown
         info("Initiating graceful shutdown...")
-
-        # Save state machines before stopping servers
-        for name, machine in state_machines.items():
-            # Sanitize validator name for filename (replace spaces and special chars)
-            safe_name = name.replace(" ", "_").replace("/", "_").replace("\\", "_")
-            state_file = os.path.join(state_dir, f"state_{safe_name}.json")
-            if machine.save_state(state_file):
+        check_executor.shutdown(wait=False, cancel_futures=True)
+        for checker in health_checkers.values():
+            checker.scraper.close()
+
+        # Save state machines (single aggregated file) before stopping servers
+        for machine in state_machines.values():
+            state_persistence.submit(machine)
+        if state_persistence.close():
+            for name, machine in state_machines.items():
                 info(f"Saved state for {name}: {machine.current_state.value}")
-            else:
-                warning(f"Failed to save state for {name}")
+        else:
+            warning(f"Failed to save validator state to {state_file}")
 
         if api_server:
             info("Stopping API server...")
@@ -594,7 +650,9 @@ def main():
 
         # Send shutdown notification
         health_reporter.send_shutdown_report()
+        alerts.close()
         info("Monitor stopped.")
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -1,36 +1,286 @@
 """Prometheus metrics scraper - remote version"""
 
+import json
 import logging
+import math
 import re
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    from json import loads as _json_loads
 
 if TYPE_CHECKING:
     from monad_monitor.huginn import HuginnClient
 
 logger = logging.getLogger(__name__)
 
+# Prometheus sample value: integers, decimals, scientific notation (e.g., 1.4896736e+07)
+NUMERIC_PATTERN = r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"
+
+# eth_blockNumber request body, serialized once for every RPC health check
+_RPC_HEALTH_PAYLOAD = json.dumps({
+    "jsonrpc": "2.0",
+    "method": "eth_blockNumber",
+    "params": [],
+    "id": 1,
+}).encode()
+_RPC_HEALTH_HEADERS = {"Content-Type": "application/json"}
+
+# CPU modes summed into total time (matches 'top' calculation)
+_CPU_MODES = frozenset({"idle", "user", "system", "nice", "iowait", "irq", "softirq", "steal"})
+
+
+# Prometheus metric name for each key returned by get_monad_metrics()
+MONAD_METRICS: Dict[str, str] = {
+    # Core consensus metrics
+    "block_commits": "monad_execution_ledger_num_commits",
+    "block_height": "monad_execution_ledger_block_num",
+    "local_timeout": "monad_state_consensus_events_local_timeout",
+    "execution_lagging": "monad_state_consensus_events_rx_execution_lagging",
+    "ts_validation_fail": "monad_state_consensus_events_failed_ts_validation",
+    "blocksync": "monad_state_blocksync_events_payload_response_successful",
+    "proposals": "monad_bft_txpool_create_proposal",
+    "peers": "monad_peer_disc_num_peers",
+    "syncing": "monad_statesync_syncing",
+}
+_MONAD_METRIC_NAMES = frozenset(MONAD_METRICS.values())
+
+# Largest unread tail drained to keep the connection pooled; a longer one is
+# dropped with the connection, since reconnecting is cheaper than reading it
+_DRAIN_MAX_BYTES = 64 * 1024
+
+# Label-free memory and TrieDB gauges from the node exporter payload
+_MEMORY_METRIC_NAMES = frozenset({
+    "node_memory_MemTotal_bytes",
+    "node_memory_MemAvailable_bytes",
+})
+_TRIEDB_METRIC_NAMES = frozenset({
+    "monad_triedb_fast_chunks",
+    "monad_triedb_fast_used_bytes",
+    "monad_triedb_fast_capacity_bytes",
+    "monad_triedb_slow_chunks",
+    "monad_triedb_slow_used_bytes",
+    "monad_triedb_slow_capacity_bytes",
+    "monad_triedb_free_chunks",
+    "monad_triedb_history_count",
+    "monad_triedb_history_max",
+})
+
+# TrieDB gauges exported with a drive="triedb" label, keyed by result field
+_TRIEDB_DRIVE_METRICS = {
+    "used_bytes": "monad_triedb_used_bytes",
+    "capacity_bytes": "monad_triedb_capacity_bytes",
+    "avail_bytes": "monad_triedb_avail_bytes",
+    "used_percent": "monad_triedb_used_percent",
+}
+
+# Every metric family parse_system_metrics() reads from the node exporter payload
+_SYSTEM_METRIC_NAMES = frozenset({
+    "node_cpu_seconds_total",
+    "node_filesystem_size_bytes",
+    "node_filesystem_avail_bytes",
+    "nvme_percentage_used_ratio",
+    "nvme_temperature_celsius",
+    *_TRIEDB_DRIVE_METRICS.values(),
+}) | _MEMORY_METRIC_NAMES | _TRIEDB_METRIC_NAMES
+
+# Sample lines grouped by metric name: name -> [(label block, value fields)]
+_SampleIndex = Dict[str, List[Tuple[str, List[str]]]]
+
+
+@lru_cache(maxsize=64)
+def _metric_pattern(metric_name: str) -> "re.Pattern[str]":
+    """Get the compiled parse_metric() pattern for a metric name (bounded cache)"""
+    # Pattern matches: metric_name{...} value [timestamp]
+    return re.compile(
+        rf"^{re.escape(metric_name)}(?:\{{[^}}]*\}})?\s+({NUMERIC_PATTERN}|NaN|-Inf|\+Inf)(?:\s+(\d+))?",
+        re.MULTILINE,
+    )
+
+
+def _split_sample(line: str) -> Optional[Tuple[str, int, int]]:
+    """Split a Prometheus sample line into (name, label start, value start).
+
+    The label start is -1 for label-free samples. Returns None for comments,
+    blank lines and malformed samples.
+    """
+    if not line or line[0] == "#":
+        return None
+
+    # Most samples are label-free ("name value"), so slice the name off
+    # at the first blank and only look for a label block before it
+    space = line.find(" ")
+    if space == -1:
+        space = line.find("\t")
+    brace = line.find("{", 0, space) if space != -1 else line.find("{")
+    if brace == -1:
+        if space == -1:
+            return None
+        return line[:space], -1, space
+
+    close = line.find("}", brace)
+    if close == -1:
+        return None
+    return line[:brace], brace, close + 1
+
+
+def _label_value(labels: str, key: str) -> Optional[str]:
+    """Get a label's value from a 'k1="v1",k2="v2"' label block"""
+    prefix = key + '="'
+    if labels.startswith(prefix):
+        start = len(prefix)
+    else:
+        pos = labels.find("," + prefix)
+        if pos == -1:
+            return None
+        start = pos + 1 + len(prefix)
+    end = labels.find('"', start)
+    return labels[start:end] if end != -1 else None
+
+
+def _finite(token: str) -> Optional[float]:
+    """Parse a sample value, returning None for malformed, NaN or Inf values"""
+    try:
+        value = float(token)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _latest_value(samples: Iterable[Tuple[str, List[str]]]) -> Optional[float]:
+    """Value of the series with the highest timestamp (the first one if none)"""
+    best_value = None
+    best_timestamp = -1
+    for _labels, fields in samples:
+        timestamp = int(fields[1]) if len(fields) > 1 and fields[1].isdigit() else 0
+        if timestamp <= best_timestamp:
+            continue
+        try:
+            value = float(fields[0])
+        except ValueError:
+            continue
+        best_timestamp = timestamp
+        best_value = value if math.isfinite(value) else None
+    return best_value
+
+
+class SystemMetricsCache:
+    """Share node exporter results between validators running on the same host.
+
+    Validators that point at one node exporter URL would otherwise each fetch
+    and parse the same payload every tick. The first caller for a URL fetches;
+    callers arriving while that fetch is in flight, or within ttl seconds of
+    it, wait for and reuse the same result.
+    """
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, "Future[Dict]"]] = {}
+
+    def get(self, node_exporter_url: str, fetch: Callable[[str], Dict]) -> Dict:
+        """Return system metrics for the URL, calling fetch(url) at most once per ttl"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(node_exporter_url)
+            if entry is not None and now - entry[0] < self.ttl:
+                shared = entry[1]
+            else:
+                shared = None
+                future: "Future[Dict]" = Future()
+                self._entries[node_exporter_url] = (now, future)
+
+        # Another validator fetched (or is fetching) this URL: reuse its result
+        if shared is not None:
+            return shared.result()
+
+        try:
+            result = fetch(node_exporter_url)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
 
 class MetricsScraper:
     """Scrape Prometheus metrics from remote validator nodes"""
 
     def __init__(
-        self, metrics_url: str, rpc_url: str, timeout: int = 10
+        self,
+        metrics_url: str,
+        rpc_url: str,
+        timeout: int = 10,
+        system_metrics_cache: Optional[SystemMetricsCache] = None,
     ):
         self.metrics_url = metrics_url
         self.rpc_url = rpc_url
         self.timeout = timeout
+        # Optional cache shared with scrapers of validators on the same host
+        self.system_metrics_cache = system_metrics_cache
 
-    def fetch_metrics(self) -> Optional[str]:
-        """Fetch metrics from remote Prometheus endpoint"""
-        try:
-            response = requests.get(self.metrics_url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Metrics fetch error: {e}")
-            return None
+        # Pooled keep-alive connections to the metrics, node exporter and RPC endpoints
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+
+        # Workers for the RPC and node exporter requests issued by scrape(), plus
+        # the validator status lookup started by submit_validator_status()
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="scrape")
+
+    def close(self) -> None:
+        """Close pooled HTTP connections and scrape workers"""
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def scrape(self, node_exporter_url: Optional[str] = None) -> Tuple[Dict, bool, Optional[Dict]]:
+        """Fetch validator metrics, RPC health and system metrics concurrently.
+
+        The three endpoints are independent, so the RPC check and the node
+        exporter request run in the worker pool while the validator metrics
+        are fetched on the calling thread. Only the I/O is parallel; system
+        metrics are parsed here once the response is in.
+
+        Args:
+            node_exporter_url: Node Exporter URL (system metrics skipped if empty)
+
+        Returns:
+            Tuple of (monad metrics, rpc healthy, system metrics or None)
+        """
+        rpc_future = self._executor.submit(self.check_rpc_health)
+        system_future = None
+        shared_system = self.system_metrics_cache is not None
+        if node_exporter_url:
+            if shared_system:
+                # Fetched and parsed once for all validators on this host
+                system_future = self._executor.submit(self.get_system_metrics, node_exporter_url)
+            else:
+                system_future = self._executor.submit(self.fetch_system_metrics, node_exporter_url)
+
+        metrics = self.get_monad_metrics()
+        rpc_healthy = rpc_future.result()
+
+        system_metrics = None
+        if system_future is not None:
+            if shared_system:
+                system_metrics = system_future.result()
+            else:
+                raw = system_future.result()
+                system_metrics = self.parse_system_metrics(raw) if raw is not None else {}
+
+        return metrics, rpc_healthy, system_metrics
 
     def parse_metric(self, metrics_text: str, metric_name: str) -> Optional[float]:
         """Parse a single metric value from Prometheus text format.
@@ -40,11 +290,8 @@ class MetricsScraper:
         When multiple matches exist, returns the value with the highest Prometheus timestamp.
         Falls back to the last match if no timestamps are present.
         """
-        # Pattern matches: metric_name{...} value [timestamp]
-        # Supports: integers, decimals, scientific notation (e.g., 1.4896736e+07), NaN, -Inf, +Inf
-        numeric_pattern = r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"
-        pattern = rf"^{metric_name}(?:\{{[^}}]*\}})?\s+({numeric_pattern}|NaN|-Inf|\+Inf)(?:\s+(\d+))?"
-        matches = list(re.finditer(pattern, metrics_text, re.MULTILINE))
+        # Supports: integers, decimals, scientific notation, NaN, -Inf, +Inf
+        matches = list(_metric_pattern(metric_name).finditer(metrics_text))
 
         if not matches:
             return None
@@ -65,92 +312,199 @@ class MetricsScraper:
             return None
         return float(value)
 
+    @staticmethod
+    def _scan_lines(
+        lines: Iterable[str], wanted: FrozenSet[str]
+    ) -> Dict[str, Optional[float]]:
+        """Extract several metrics from Prometheus text lines in a single pass.
+
+        Same result as calling parse_metric() for each name in wanted, but the
+        payload is walked once instead of once per metric. Absent metrics are
+        missing from the result and NaN/Inf values map to None. When a metric
+        has multiple time series, the one with the highest timestamp wins
+        (the first one if no timestamps are present).
+
+        Accepts any iterable of lines, e.g. a streamed body. Stops reading once
+        every wanted metric has been seen and a line of a different metric
+        follows. The exposition format keeps all series of a metric together,
+        so no later series can be missed.
+
+        Args:
+            lines: Prometheus text exposition lines
+            wanted: Metric names to extract
+
+        Returns:
+            Dict of metric name -> parsed value
+        """
+        values: Dict[str, Optional[float]] = {}
+        timestamps: Dict[str, int] = {}
+        remaining = set(wanted)
+        isfinite = math.isfinite
+        # C-level prefilter: most lines belong to metrics nobody asked for
+        prefixes = tuple(wanted)
+
+        for line in lines:
+            if not line.startswith(prefixes):
+                # Comments and blank lines do not end a metric's series
+                if not remaining and line and line[0] != "#":
+                    break
+                continue
+            sample = _split_sample(line)
+            if sample is None:
+                continue
+            name, _, rest = sample
+
+            if name not in wanted:
+                if not remaining:
+                    break
+                continue
+            remaining.discard(name)
+
+            fields = line[rest:].split()
+            if not fields:
+                continue
+            timestamp = int(fields[1]) if len(fields) > 1 and fields[1].isdigit() else 0
+            # A series no newer than the one already kept loses; skip parsing its value
+            if timestamp <= timestamps.get(name, -1):
+                continue
+            try:
+                value = float(fields[0])
+            except ValueError:
+                continue
+            timestamps[name] = timestamp
+            values[name] = value if isfinite(value) else None
+
+        return values
+
     def get_monad_metrics(self) -> Dict:
-        """Fetch Monad-specific metrics from validator"""
-        raw = self.fetch_metrics()
+        """Fetch Monad-specific metrics from validator
 
-        if not raw:
+        The response is streamed line by line into the scanner, so parsing
+        overlaps the download and the body is never held as a single string.
+        """
+        try:
+            with self._session.get(
+                self.metrics_url, timeout=self.timeout, stream=True
+            ) as response:
+                if response.status_code >= 400:
+                    logger.debug("Metrics fetch error: HTTP %d", response.status_code)
+                    return {"error": "Could not fetch metrics"}
+                if response.encoding is None:
+                    response.encoding = "utf-8"
+                lines = response.iter_lines(decode_unicode=True)
+
+                first = next(lines, None)
+                if first is None:
+                    return {"error": "Could not fetch metrics"}
+                values = self._scan_lines(chain((first,), lines), _MONAD_METRIC_NAMES)
+                # The scan may stop early: drain a short unread tail so the connection
+                # returns to the pool, otherwise leaving the block closes it unread
+                if self._unread_bytes(response) <= _DRAIN_MAX_BYTES:
+                    response.raw.drain_conn()
+        except requests.exceptions.RequestException as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Metrics fetch error: %s", e)
             return {"error": "Could not fetch metrics"}
 
-        return {
-            # Core consensus metrics
-            "block_commits": self.parse_metric(
-                raw, "monad_execution_ledger_num_commits"
-            ),
-            "block_height": self.parse_metric(
-                raw, "monad_execution_ledger_block_num"
-            ),
-            "local_timeout": self.parse_metric(
-                raw, "monad_state_consensus_events_local_timeout"
-            ),
-            "execution_lagging": self.parse_metric(
-                raw, "monad_state_consensus_events_rx_execution_lagging"
-            ),
-            "ts_validation_fail": self.parse_metric(
-                raw, "monad_state_consensus_events_failed_ts_validation"
-            ),
-            "blocksync": self.parse_metric(
-                raw, "monad_state_blocksync_events_payload_response_successful"
-            ),
-            "proposals": self.parse_metric(
-                raw, "monad_bft_txpool_create_proposal"
-            ),
-            "peers": self.parse_metric(raw, "monad_peer_disc_num_peers"),
-            "syncing": self.parse_metric(raw, "monad_statesync_syncing"),
-        }
+        return {key: values.get(name) for key, name in MONAD_METRICS.items()}
+
+    @staticmethod
+    def _unread_bytes(response: requests.Response) -> float:
+        """Bytes of the body not yet read off the wire; inf when the length is unknown"""
+        try:
+            length = int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return math.inf
+        return max(length - response.raw.tell(), 0)
 
     def get_system_metrics(self, node_exporter_url: str) -> Dict:
         """Fetch system metrics from Node Exporter (optional)"""
         if not node_exporter_url:
             return {}
 
-        try:
-            resp = requests.get(node_exporter_url, timeout=self.timeout)
-            resp.raise_for_status()
-            raw = resp.text
-
-            # Parse CPU metrics - calculate usage from idle
-            cpu_idle = self._parse_cpu_idle(raw)
-            mem_total = self.parse_metric(raw, "node_memory_MemTotal_bytes")
-            mem_available = self.parse_metric(raw, "node_memory_MemAvailable_bytes")
-            mem_used = None
-            mem_percent = None
-            if mem_total and mem_available:
-                mem_used = mem_total - mem_available
-                mem_percent = (mem_used / mem_total) * 100
-
-            # Parse disk metrics
-            disk_metrics = self._parse_disk_metrics(raw)
+        if self.system_metrics_cache is not None:
+            return self.system_metrics_cache.get(node_exporter_url, self._get_system_metrics)
+        return self._get_system_metrics(node_exporter_url)
 
-            # Parse TrieDB metrics
-            triedb_metrics = self._parse_triedb_metrics(raw)
+    def _get_system_metrics(self, node_exporter_url: str) -> Dict:
+        raw = self.fetch_system_metrics(node_exporter_url)
+        if raw is None:
+            return {}
+        return self.parse_system_metrics(raw)
 
-            # Parse NVMe SMART metrics
-            nvme_metrics = self._parse_nvme_metrics(raw)
+    def fetch_system_metrics(self, node_exporter_url: str) -> Optional[str]:
+        """Fetch raw metrics text from Node Exporter"""
+        try:
+            resp = self._session.get(node_exporter_url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Node exporter fetch error: %s", e)
+            return None
+        if resp.status_code >= 400:
+            logger.debug("Node exporter fetch error: HTTP %d", resp.status_code)
+            return None
+        return resp.text
+
+    @staticmethod
+    def _index_samples(raw: str, wanted: FrozenSet[str] = _SYSTEM_METRIC_NAMES) -> _SampleIndex:
+        """Split the payload once and group the wanted samples by metric name"""
+        index: _SampleIndex = {}
+        for line in raw.split("\n"):
+            sample = _split_sample(line)
+            if sample is None or sample[0] not in wanted:
+                continue
+            name, brace, rest = sample
+            fields = line[rest:].split()
+            if fields:
+                labels = line[brace + 1:rest - 1] if brace != -1 else ""
+                index.setdefault(name, []).append((labels, fields))
+        return index
+
+    def parse_system_metrics(self, raw: str) -> Dict:
+        """Parse CPU/RAM/Disk/TrieDB/NVMe metrics from Node Exporter text"""
+        # Split the body once; every parser below reads its samples by name
+        index = self._index_samples(raw)
+
+        # Parse CPU metrics - calculate usage from idle
+        cpu_idle = self._parse_cpu_idle(index)
+        mem_total = _latest_value(index.get("node_memory_MemTotal_bytes", ()))
+        mem_available = _latest_value(index.get("node_memory_MemAvailable_bytes", ()))
+        mem_used = None
+        mem_percent = None
+        if mem_total and mem_available:
+            mem_used = mem_total - mem_available
+            mem_percent = (mem_used / mem_total) * 100
+
+        # Parse disk metrics
+        disk_metrics = self._parse_disk_metrics(index)
+
+        # Parse TrieDB metrics
+        triedb_metrics = self._parse_triedb_metrics(index)
+
+        # Parse NVMe SMART metrics
+        nvme_metrics = self._parse_nvme_metrics(index)
 
-            return {
-                # CPU
-                "cpu_idle_percent": cpu_idle,
-                "cpu_used_percent": 100 - cpu_idle if cpu_idle else None,
-                # Memory
-                "mem_total": mem_total,
-                "mem_available": mem_available,
-                "mem_used": mem_used,
-                "mem_percent": mem_percent,
-                # Disk
-                "disk_total_bytes": disk_metrics.get("total"),
-                "disk_used_bytes": disk_metrics.get("used"),
-                "disk_avail_bytes": disk_metrics.get("available"),
-                "disk_percent": disk_metrics.get("percent"),
-                # TrieDB
-                "triedb": triedb_metrics,
-                # NVMe SMART
-                "nvme": nvme_metrics,
-            }
-        except requests.exceptions.RequestException:
-            return {}
+        return {
+            # CPU
+            "cpu_idle_percent": cpu_idle,
+            "cpu_used_percent": 100 - cpu_idle if cpu_idle else None,
+            # Memory
+            "mem_total": mem_total,
+            "mem_available": mem_available,
+            "mem_used": mem_used,
+            "mem_percent": mem_percent,
+            # Disk
+            "disk_total_bytes": disk_metrics.get("total"),
+            "disk_used_bytes": disk_metrics.get("used"),
+            "disk_avail_bytes": disk_metrics.get("available"),
+            "disk_percent": disk_metrics.get("percent"),
+            # TrieDB
+            "triedb": triedb_metrics,
+            # NVMe SMART
+            "nvme": nvme_metrics,
+        }
 
-    def _parse_cpu_idle(self, raw: str) -> Optional[float]:
+    def _parse_cpu_idle(self, raw: Union[str, _SampleIndex]) -> Optional[float]:
         """Parse CPU idle percentage from node exporter metrics
 
         Uses cumulative ratio calculation (same as 'top' command).
@@ -159,47 +513,28 @@ class MetricsScraper:
         For cumulative counters like node_cpu_seconds_total, we use the ratio
         of idle time to total time, which gives us average CPU usage over uptime.
 
+        Args:
+            raw: Node exporter text, or samples already grouped by _index_samples()
+
         Returns:
             Idle percentage (100 = 100% idle, 0 = 100% CPU usage)
         """
-        # Pattern to match all CPU metrics with cpu number and mode
-        cpu_pattern = r'^node_cpu_seconds_total\{cpu="(\d+)",mode="([^"]+)"\}\s+([\d.e+-]+)'
+        index = self._index_samples(raw) if isinstance(raw, str) else raw
 
-        # Parse all CPU metrics and sum across all cores and all modes
+        # Single pass: sum all cores and all modes into total/idle accumulators
+        total_time = 0.0
         total_idle = 0.0
-        total_user = 0.0
-        total_system = 0.0
-        total_nice = 0.0
-        total_iowait = 0.0
-        total_irq = 0.0
-        total_softirq = 0.0
-        total_steal = 0.0
-
-        for match in re.finditer(cpu_pattern, raw, re.MULTILINE):
-            mode = match.group(2)
-            value = float(match.group(3))
-
-            # Sum all cores for each mode (matches 'top' calculation)
+
+        for labels, fields in index.get("node_cpu_seconds_total", ()):
+            mode = _label_value(labels, "mode")
+            if mode not in _CPU_MODES:
+                continue
+            value = _finite(fields[0])
+            if value is None:
+                continue
+            total_time += value
             if mode == "idle":
                 total_idle += value
-            elif mode == "user":
-                total_user += value
-            elif mode == "system":
-                total_system += value
-            elif mode == "nice":
-                total_nice += value
-            elif mode == "iowait":
-                total_iowait += value
-            elif mode == "irq":
-                total_irq += value
-            elif mode == "softirq":
-                total_softirq += value
-            elif mode == "steal":
-                total_steal += value
-
-        # Calculate total time across all modes (all cores, all modes)
-        total_time = (total_idle + total_user + total_system + total_nice +
-                      total_iowait + total_irq + total_softirq + total_steal)
 
         if total_time > 0:
             # Return idle percentage (CPU used = 100 - idle)
@@ -207,21 +542,20 @@ class MetricsScraper:
 
         return None
 
-    def _parse_disk_metrics(self, raw: str) -> Dict:
+    def _parse_disk_metrics(self, raw: Union[str, _SampleIndex]) -> Dict:
         """Parse disk usage metrics from node exporter"""
+        index = self._index_samples(raw) if isinstance(raw, str) else raw
         result = {}
 
-        # Look for root filesystem metrics (mountpoint="/")
-        avail_pattern = r'^node_filesystem_avail_bytes\{[^}]*mountpoint="/"[^}]*\}\s+([\d.e+-]+)'
-        size_pattern = r'^node_filesystem_size_bytes\{[^}]*mountpoint="/"[^}]*\}\s+([\d.e+-]+)'
-
-        avail_match = re.search(avail_pattern, raw, re.MULTILINE)
-        size_match = re.search(size_pattern, raw, re.MULTILINE)
-
-        if size_match:
-            result["total"] = float(size_match.group(1))
-        if avail_match:
-            result["available"] = float(avail_match.group(1))
+        # Look for root filesystem metrics (mountpoint="/"), first series wins
+        for key, name in (("total", "node_filesystem_size_bytes"),
+                          ("available", "node_filesystem_avail_bytes")):
+            for labels, fields in index.get(name, ()):
+                if _label_value(labels, "mountpoint") == "/":
+                    value = _finite(fields[0])
+                    if value is not None:
+                        result[key] = value
+                    break
 
         if result.get("total") and result.get("available"):
             result["used"] = result["total"] - result["available"]
@@ -229,34 +563,27 @@ class MetricsScraper:
 
         return result
 
-    def _parse_triedb_metrics(self, raw: str) -> Dict:
+    def _parse_triedb_metrics(self, raw: Union[str, _SampleIndex]) -> Dict:
         """Parse TrieDB metrics from node exporter textfile collector"""
+        index = self._index_samples(raw) if isinstance(raw, str) else raw
         result = {}
 
-        # Main TrieDB metrics (with drive="triedb" label)
-        used_pattern = r'^monad_triedb_used_bytes\{drive="triedb"\}\s+([\d.e+-]+)'
-        capacity_pattern = r'^monad_triedb_capacity_bytes\{drive="triedb"\}\s+([\d.e+-]+)'
-        avail_pattern = r'^monad_triedb_avail_bytes\{drive="triedb"\}\s+([\d.e+-]+)'
-        percent_pattern = r'^monad_triedb_used_percent\{drive="triedb"\}\s+([\d.e+-]+)'
-
-        used_match = re.search(used_pattern, raw, re.MULTILINE)
-        capacity_match = re.search(capacity_pattern, raw, re.MULTILINE)
-        avail_match = re.search(avail_pattern, raw, re.MULTILINE)
-        percent_match = re.search(percent_pattern, raw, re.MULTILINE)
-
-        if used_match:
-            result["used_bytes"] = float(used_match.group(1))
-        if capacity_match:
-            result["capacity_bytes"] = float(capacity_match.group(1))
-        if avail_match:
-            result["avail_bytes"] = float(avail_match.group(1))
-        if percent_match:
-            result["used_percent"] = float(percent_match.group(1))
+        # Main TrieDB metrics (with drive="triedb" label), first series wins
+        for key, name in _TRIEDB_DRIVE_METRICS.items():
+            for labels, fields in index.get(name, ()):
+                if labels == 'drive="triedb"':
+                    value = _finite(fields[0])
+                    if value is not None:
+                        result[key] = value
+                    break
+
+        # Label-free TrieDB metrics
+        values = {name: _latest_value(index.get(name, ())) for name in _TRIEDB_METRIC_NAMES}
 
         # Fast chunks metrics
-        fast_chunks = self.parse_metric(raw, "monad_triedb_fast_chunks")
-        fast_used = self.parse_metric(raw, "monad_triedb_fast_used_bytes")
-        fast_capacity = self.parse_metric(raw, "monad_triedb_fast_capacity_bytes")
+        fast_chunks = values.get("monad_triedb_fast_chunks")
+        fast_used = values.get("monad_triedb_fast_used_bytes")
+        fast_capacity = values.get("monad_triedb_fast_capacity_bytes")
 
         if fast_chunks is not None:
             result["fast_chunks"] = int(fast_chunks)
@@ -266,9 +593,9 @@ class MetricsScraper:
             result["fast_capacity_bytes"] = fast_capacity
 
         # Slow chunks metrics
-        slow_chunks = self.parse_metric(raw, "monad_triedb_slow_chunks")
-        slow_used = self.parse_metric(raw, "monad_triedb_slow_used_bytes")
-        slow_capacity = self.parse_metric(raw, "monad_triedb_slow_capacity_bytes")
+        slow_chunks = values.get("monad_triedb_slow_chunks")
+        slow_used = values.get("monad_triedb_slow_used_bytes")
+        slow_capacity = values.get("monad_triedb_slow_capacity_bytes")
 
         if slow_chunks is not None:
             result["slow_chunks"] = int(slow_chunks)
@@ -278,13 +605,13 @@ class MetricsScraper:
             result["slow_capacity_bytes"] = slow_capacity
 
         # Free chunks
-        free_chunks = self.parse_metric(raw, "monad_triedb_free_chunks")
+        free_chunks = values.get("monad_triedb_free_chunks")
         if free_chunks is not None:
             result["free_chunks"] = int(free_chunks)
 
         # History metrics
-        history_count = self.parse_metric(raw, "monad_triedb_history_count")
-        history_max = self.parse_metric(raw, "monad_triedb_history_max")
+        history_count = values.get("monad_triedb_history_count")
+        history_max = values.get("monad_triedb_history_max")
 
         if history_count is not None:
             result["history_count"] = int(history_count)
@@ -293,50 +620,71 @@ class MetricsScraper:
 
         return result
 
-    def _parse_nvme_metrics(self, raw: str) -> Dict:
+    def _parse_nvme_metrics(self, raw: Union[str, _SampleIndex]) -> Dict:
         """Parse NVMe SMART metrics from node exporter textfile collector"""
+        index = self._index_samples(raw) if isinstance(raw, str) else raw
         result = {"nvme_wear": {}, "nvme_temp": {}}
 
-        wear_pattern = r'^nvme_percentage_used_ratio\{device="([^"]+)"\}\s+([\d.e+-]+)'
-        for match in re.finditer(wear_pattern, raw, re.MULTILINE):
-            device = match.group(1)
-            ratio = float(match.group(2))
-            result["nvme_wear"][device] = ratio * 100
+        for labels, fields in index.get("nvme_percentage_used_ratio", ()):
+            device = _label_value(labels, "device")
+            ratio = _finite(fields[0])
+            if device is not None and ratio is not None:
+                result["nvme_wear"][device] = ratio * 100
 
-        temp_pattern = r'^nvme_temperature_celsius\{device="([^"]+)"\}\s+([\d.e+-]+)'
-        for match in re.finditer(temp_pattern, raw, re.MULTILINE):
-            device = match.group(1)
-            result["nvme_temp"][device] = float(match.group(2))
+        for labels, fields in index.get("nvme_temperature_celsius", ()):
+            device = _label_value(labels, "device")
+            temp = _finite(fields[0])
+            if device is not None and temp is not None:
+                result["nvme_temp"][device] = temp
 
         return result
 
     def check_rpc_health(self) -> bool:
         """Check if RPC endpoint is responding"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_blockNumber",
-                "params": [],
-                "id": 1,
-            }
-            response = requests.post(
+            response = self._session.post(
                 self.rpc_url,
-                json=payload,
+                data=_RPC_HEALTH_PAYLOAD,
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json"},
+                headers=_RPC_HEALTH_HEADERS,
             )
-            response.raise_for_status()
-            result = response.json()
+            if response.status_code >= 400:
+                return False
+            result = _json_loads(response.content)
             return "result" in result
-        except requests.exceptions.RequestException:
+        except (requests.exceptions.RequestException, ValueError):
             return False
 
+    def submit_validator_status(
+        self,
+        validator_secp: str,
+        huginn_client: Optional["HuginnClient"] = None,
+        network: str = "testnet",
+        gmonads_client: Optional[Any] = None,
+    ) -> "Future[Optional[Dict]]":
+        """
+        Start the Huginn/gmonads validator status lookup in the worker pool.
+
+        The lookup does not depend on this tick's metrics, so it can overlap
+        with scrape(). Pass the returned future to get_validator_status() as
+        remote_status once the metrics are in.
+        """
+        return self._executor.submit(
+            self.fetch_remote_validator_status,
+            validator_secp,
+            huginn_client=huginn_client,
+            network=network,
+            gmonads_client=gmonads_client,
+        )
+
     def get_validator_status(
         self,
         validator_secp: str,
         huginn_client: Optional["HuginnClient"] = None,
         network: str = "testnet",
         gmonads_client: Optional[Any] = None,
+        monad_metrics: Optional[Dict] = None,
+        remote_status: Optional["Future[Optional[Dict]]"] = None,
     ) -> Dict:
         """
         Determine if validator is in the active set.
@@ -351,11 +699,44 @@ class MetricsScraper:
             huginn_client: Optional Huginn API client for external verification
             network: Network name ('testnet' or 'mainnet'). Defaults to 'testnet'.
             gmonads_client: Optional GmonadsClient for active set verification fallback.
+            monad_metrics: Optional get_monad_metrics() result from this tick,
+                reused by local inference instead of fetching the metrics again.
+            remote_status: Optional submit_validator_status() future for this
+                tick, awaited instead of querying Huginn/gmonads again.
 
         Returns:
             Dict with 'is_active' (bool), 'reason' (str), 'source' (str),
             and additional data depending on source
         """
+        if remote_status is not None:
+            status = remote_status.result()
+        else:
+            status = self.fetch_remote_validator_status(
+                validator_secp,
+                huginn_client=huginn_client,
+                network=network,
+                gmonads_client=gmonads_client,
+            )
+        if status is not None:
+            return status
+
+        # Fallback 2: Infer from local Prometheus metrics (last resort)
+        return self._infer_validator_status(validator_secp, monad_metrics)
+
+    def fetch_remote_validator_status(
+        self,
+        validator_secp: str,
+        huginn_client: Optional["HuginnClient"] = None,
+        network: str = "testnet",
+        gmonads_client: Optional[Any] = None,
+    ) -> Optional[Dict]:
+        """
+        Determine active set status from Huginn, falling back to gmonads.
+
+        Returns:
+            Status dict as described in get_validator_status(), or None if
+            neither API could determine the status
+        """
         # Try Huginn API first if client is provided (most detailed)
         if huginn_client and validator_secp:
             uptime = huginn_client.get_validator_uptime(
@@ -401,10 +782,11 @@ class MetricsScraper:
                     "source": "gmonads_api",
                 }
 
-        # Fallback 2: Infer from local Prometheus metrics (last resort)
-        return self._infer_validator_status(validator_secp)
+        return None
 
-    def _infer_validator_status(self, validator_secp: str) -> Dict:
+    def _infer_validator_status(
+        self, validator_secp: str, monad_metrics: Optional[Dict] = None
+    ) -> Dict:
         """
         Infer validator active status from local Prometheus metrics.
 
@@ -416,24 +798,29 @@ class MetricsScraper:
 
         Args:
             validator_secp: The validator's secp256k1 public key (for logging)
+            monad_metrics: Already-fetched get_monad_metrics() result, if any
 
         Returns:
             Dict with 'is_active', 'reason', 'source', and 'metrics_used'
         """
-        raw = self.fetch_metrics()
+        if not monad_metrics or "error" in monad_metrics:
+            # Streamed scan: the body is never decoded or split as a whole
+            monad_metrics = self.get_monad_metrics()
 
-        if not raw:
-            return {
-                "is_active": None,  # Unknown - cannot determine
-                "reason": "Could not fetch metrics to determine validator status",
-                "source": "inference",
-                "metrics_used": [],
-            }
+            if "error" in monad_metrics:
+                return {
+                    "is_active": None,  # Unknown - cannot determine
+                    "reason": "Could not fetch metrics to determine validator status",
+                    "source": "inference",
+                    "metrics_used": [],
+                }
+
+        proposals = monad_metrics.get("proposals")
+        block_commits = monad_metrics.get("block_commits")
 
         metrics_used = []
 
         # Strategy 1: Check for proposal creation (indicates active proposer)
-        proposals = self.parse_metric(raw, "monad_bft_txpool_create_proposal")
         if proposals is not None and proposals > 0:
             metrics_used.append("monad_bft_txpool_create_proposal")
             return {
@@ -446,7 +833,6 @@ class MetricsScraper:
 
         # Strategy 2: Check block commits
         # If validator has commits, it's participating in consensus
-        block_commits = self.parse_metric(raw, "monad_execution_ledger_num_commits")
         if block_commits is not None and block_commits > 0:
             metrics_used.append("monad_execution_ledger_num_commits")
             return {
@@ -2,11 +2,12 @@
 
 import time
 import threading
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from time import monotonic as _now
+from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucketRateLimiter:
     """
     Thread-safe token bucket rate limiter.
@@ -23,58 +24,71 @@ class TokenBucketRateLimiter:
     max_tokens: float
     refill_rate: float  # Tokens per second
     tokens: float = 0.0
-    last_refill: float = 0.0
-    _lock: threading.Lock = None  # type: ignore
+    last_refill: float = 0.0  # Monotonic clock reading, only compared to itself
+    _lock: threading.Lock = field(default=None, init=False, repr=False, compare=False)  # type: ignore
+    _acquire: Any = field(default=None, init=False, repr=False, compare=False)
+    _release: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.tokens = self.max_tokens
-        self.last_refill = time.time()
+        self.last_refill = _now()
         self._lock = threading.Lock()
+        # Pre-bound lock methods for the per-alert consume()/can_consume() path
+        self._acquire = self._lock.acquire
+        self._release = self._lock.release
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time (internal method)"""
-        now = time.time()
-        elapsed = now - self.last_refill
-        new_tokens = elapsed * self.refill_rate
+        now = _now()
+        new_tokens = (now - self.last_refill) * self.refill_rate
+        # Back-to-back calls (can_consume() then consume()) accrue next to
+        # nothing; leave last_refill alone so the elapsed time keeps counting
+        if new_tokens < 0.001:
+            return
         self.tokens = min(self.max_tokens, self.tokens + new_tokens)
         self.last_refill = now
 
     def can_consume(self, tokens: int = 1) -> bool:
         """Check if tokens are available without consuming"""
-        with self._lock:
+        self._acquire()
+        try:
             self._refill()
             return self.tokens >= tokens
+        finally:
+            self._release()
 
     def consume(self, tokens: int = 1) -> bool:
         """
         Try to consume tokens. Returns True if successful, False if insufficient tokens.
         Does not consume on failure.
         """
-        with self._lock:
+        self._acquire()
+        try:
             self._refill()
             if self.tokens >= tokens:
                 self.tokens -= tokens
                 return True
             return False
+        finally:
+            self._release()
 
     def consume_or_wait(self, tokens: int = 1, max_wait: float = 0.0) -> bool:
         """
         Try to consume tokens, waiting up to max_wait seconds if necessary.
 
-        NOTE: This method has inherent race condition semantics. After waiting,
-        another thread may have consumed the tokens. In that case, the method
-        returns False without consuming. This is intentional - it provides
-        "best effort" waiting without blocking other consumers indefinitely.
-
-        For guaranteed consumption, use consume() in a loop with your own
-        waiting logic, or consider using a semaphore instead.
+        When the bucket is short, the tokens are reserved under the lock
+        before sleeping: the count goes negative by the shortfall, so other
+        callers queue behind the reservation instead of racing for the same
+        refill. The sleep then lasts exactly until the reserved tokens have
+        accrued, and no second refill or re-check is needed afterwards.
 
         Args:
             tokens: Number of tokens to consume
             max_wait: Maximum time to wait in seconds (0 = no wait)
 
         Returns:
-            True if tokens were consumed, False if timeout or tokens unavailable
+            True if tokens were consumed, False if they would not be
+            available within max_wait (nothing is consumed in that case)
         """
         with self._lock:
             self._refill()
@@ -82,26 +96,20 @@ class TokenBucketRateLimiter:
                 self.tokens -= tokens
                 return True
 
-            if max_wait <= 0:
+            if max_wait <= 0 or tokens > self.max_tokens:
                 return False
 
-            # Calculate wait time needed
-            tokens_needed = tokens - self.tokens
-            wait_time = min(max_wait, tokens_needed / self.refill_rate)
-
+            # Time until the bucket holds enough tokens
+            wait_time = (tokens - self.tokens) / self.refill_rate
             if wait_time > max_wait:
                 return False
 
-        # Wait outside the lock to allow other threads to consume
-        time.sleep(wait_time)
+            # Reserve now; the debt is paid off by refills while we sleep
+            self.tokens -= tokens
 
-        # Try again after waiting (may fail if another thread consumed tokens)
-        with self._lock:
-            self._refill()
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+        # Wait outside the lock to allow other threads to proceed
+        time.sleep(wait_time)
+        return True
 
     def remaining_tokens(self) -> float:
         """Get current number of available tokens (after refill)"""
@@ -125,21 +133,41 @@ class TokenBucketRateLimiter:
         """Reset bucket to full capacity"""
         with self._lock:
             self.tokens = self.max_tokens
-            self.last_refill = time.time()
+            self.last_refill = _now()
 
     @classmethod
     def telegram_rate_limiter(cls) -> "TokenBucketRateLimiter":
         """
-        Create a rate limiter for Telegram API.
+        Get the shared rate limiter for Telegram API (created on first use).
         Profile: 10 alerts per minute (burst), 10/min sustained
         """
-        return cls(max_tokens=10, refill_rate=10.0 / 60.0)  # ~0.167 tokens/sec
+        limiter = _shared_limiters.get("telegram")
+        if limiter is None:
+            limiter = _shared_limiters.setdefault(
+                "telegram", cls(max_tokens=10, refill_rate=10.0 / 60.0)  # ~0.167 tokens/sec
+            )
+        return limiter
 
     @classmethod
     def pushover_rate_limiter(cls) -> "TokenBucketRateLimiter":
         """
-        Create a rate limiter for Pushover API.
+        Get the shared rate limiter for Pushover API (created on first use).
         Profile: 5 alerts per minute (burst), 5/min sustained
         Pushover has stricter limits for emergency priority.
         """
-        return cls(max_tokens=5, refill_rate=5.0 / 60.0)  # ~0.083 tokens/sec
+        limiter = _shared_limiters.get("pushover")
+        if limiter is None:
+            limiter = _shared_limiters.setdefault(
+                "pushover", cls(max_tokens=5, refill_rate=5.0 / 60.0)  # ~0.083 tokens/sec
+            )
+        return limiter
+
+
+# Process-wide limiters handed out by the factory classmethods, so token state
+# survives re-initialization of the alerting code
+_shared_limiters: Dict[str, TokenBucketRateLimiter] = {}
+
+
+def reset_singletons() -> None:
+    """Drop the shared factory limiters (used by tests)"""
+    _shared_limiters.clear()
@@ -2,11 +2,41 @@
 
 import json
 import logging
+import os
+import queue
+import threading
 import time
+from collections import deque
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any, List, ClassVar
+from typing import Optional, Dict, Any, Deque, FrozenSet, Iterable, List, ClassVar, Mapping, Tuple
+
+# State files are indented for operators reading them; the transition log
+# stays compact, one JSON object per line
+try:
+    from orjson import OPT_INDENT_2, dumps as _json_dumps, loads as _json_loads
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return _json_dumps(obj, option=OPT_INDENT_2)
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+# Wall-clock source for state timestamps (persisted, so not monotonic)
+_now = time.time
+
+# Size at which the transition history log is rotated to "<log>.1"
+TRANSITION_LOG_MAX_BYTES = 1024 * 1024
 
 
 class ValidatorState(Enum):
@@ -22,43 +52,97 @@ class ValidatorState(Enum):
     INACTIVE = "inactive"
 
 
-@dataclass
+# Shared read-only default for transitions recorded without metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class StateTransition:
     """Record of a state transition"""
     from_state: ValidatorState
     to_state: ValidatorState
     validator_name: str
     timestamp: float
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA, compare=False)
 
     def is_significant(self) -> bool:
         """Check if this transition should trigger an alert"""
         # NEW -> ACTIVE: Validator entered active set
         # ACTIVE -> INACTIVE: Validator dropped from active set
         # INACTIVE -> ACTIVE: Validator re-entered active set
-        return self.from_state != self.to_state
+        return self.from_state is not self.to_state
+
+    # Alert message templates for the significant transitions
+    _ALERT_TEMPLATES: ClassVar[Dict[Tuple[ValidatorState, ValidatorState], str]] = {
+        (ValidatorState.NEW, ValidatorState.ACTIVE): (
+            "🟢 *{name} ENTERED ACTIVE SET*\n\n"
+            "Validator is now in the active set and producing blocks!"
+        ),
+        (ValidatorState.ACTIVE, ValidatorState.INACTIVE): (
+            "⚪ *{name} LEFT ACTIVE SET*\n\n"
+            "Validator is no longer in the active set.\n"
+            "Block production alerts disabled until re-entry."
+        ),
+        (ValidatorState.INACTIVE, ValidatorState.ACTIVE): (
+            "🟢 *{name} RE-ENTERED ACTIVE SET*\n\n"
+            "Validator is back in the active set!\n"
+            "Block production alerts re-enabled."
+        ),
+    }
 
     def get_alert_message(self) -> str:
         """Generate alert message for this transition"""
-        if self.from_state == ValidatorState.NEW and self.to_state == ValidatorState.ACTIVE:
-            msg = f"🟢 *{self.validator_name} ENTERED ACTIVE SET*\n\n"
-            msg += "Validator is now in the active set and producing blocks!"
-            return msg
-
-        elif self.from_state == ValidatorState.ACTIVE and self.to_state == ValidatorState.INACTIVE:
-            msg = f"⚪ *{self.validator_name} LEFT ACTIVE SET*\n\n"
-            msg += "Validator is no longer in the active set.\n"
-            msg += "Block production alerts disabled until re-entry."
-            return msg
-
-        elif self.from_state == ValidatorState.INACTIVE and self.to_state == ValidatorState.ACTIVE:
-            msg = f"🟢 *{self.validator_name} RE-ENTERED ACTIVE SET*\n\n"
-            msg += "Validator is back in the active set!\n"
-            msg += "Block production alerts re-enabled."
-            return msg
+        template = self._ALERT_TEMPLATES.get((self.from_state, self.to_state))
+        if template is not None:
+            return template.format(name=self.validator_name)
 
         return f"ℹ️ {self.validator_name}: State changed from {self.from_state.value} to {self.to_state.value}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to one compact transition log entry"""
+        return {
+            "t": self.timestamp,
+            "v": self.validator_name,
+            "from": self.from_state.value,
+            "to": self.to_state.value,
+            "meta": dict(self.metadata),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StateTransition":
+        """
+        Deserialize a transition log entry written by to_dict().
+
+        Raises:
+            KeyError, TypeError, ValueError: If the entry is malformed
+        """
+        return cls(
+            from_state=ValidatorState(data["from"]),
+            to_state=ValidatorState(data["to"]),
+            validator_name=data["v"],
+            timestamp=float(data["t"]),
+            metadata=MappingProxyType(dict(data.get("meta") or {})),
+        )
+
+
+@lru_cache(maxsize=256)
+def _validated_fields(validator_name: str, state_value: str) -> Optional[Tuple[str, ValidatorState]]:
+    """
+    Validate a (validator_name, current_state) pair from a persisted payload.
+
+    Memoized so repeated identical payloads (many validators restored in the
+    same state) skip validation and enum resolution.
+
+    Returns:
+        (validator_name, state), or None if either field needs repair
+    """
+    if not validator_name:
+        return None
+    try:
+        return validator_name, ValidatorState(state_value)
+    except ValueError:
+        return None
+
 
 class ValidatorStateMachine:
     """
@@ -76,16 +160,42 @@ class ValidatorStateMachine:
     """
 
     # Alert types that should always trigger regardless of state
-    ALWAYS_ALERT_TYPES = {"node_down", "connection_failed", "rpc_error"}
+    ALWAYS_ALERT_TYPES: ClassVar[FrozenSet[str]] = frozenset({"node_down", "connection_failed", "rpc_error"})
 
     # Alert types that should only trigger for ACTIVE validators
-    ACTIVE_ONLY_ALERT_TYPES = {"local_timeout", "ts_validation_fail", "execution_lagging"}
-
-    def __init__(self, validator_name: str, initial_state: Optional[ValidatorState] = None):
+    ACTIVE_ONLY_ALERT_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"local_timeout", "ts_validation_fail", "execution_lagging"}
+    )
+
+    # Alert threshold level for each state (see get_alert_threshold). Looked up
+    # on demand: main.py restores current_state by direct assignment on startup
+    ALERT_THRESHOLDS: ClassVar[Dict[ValidatorState, str]] = {
+        ValidatorState.NEW: "minimal",
+        ValidatorState.ACTIVE: "full",
+        ValidatorState.INACTIVE: "recovery",
+    }
+
+    # Transitions kept in memory with keep_history=True; older ones are
+    # dropped (the count is not)
+    MAX_TRANSITION_HISTORY: ClassVar[int] = 256
+
+    def __init__(
+        self,
+        validator_name: str,
+        initial_state: Optional[ValidatorState] = None,
+        keep_history: bool = False,
+    ):
         self.validator_name = validator_name
         self.current_state = initial_state or ValidatorState.NEW
-        self._state_entered_at: float = time.time()
-        self._transition_history: List[StateTransition] = []
+        self._state_entered_at: float = _now()
+        # None unless requested: the monitor keeps its history in the transition log
+        self._transition_history: Optional[Deque[StateTransition]] = (
+            deque(maxlen=self.MAX_TRANSITION_HISTORY) if keep_history else None
+        )
+        self._total_transitions: int = 0
+        # Unsaved changes since the last save_state(); True forces the first write
+        self._dirty: bool = True
+        self._last_saved: Optional[Tuple[Any, ...]] = None
 
     def update(
         self,
@@ -113,23 +223,28 @@ class ValidatorStateMachine:
             new_state = ValidatorState.NEW
 
         # Check if state changed
-        if new_state == self.current_state:
+        if new_state is self.current_state:
             return None
 
+        # One clock read: the transition record and the state entry time match
+        now = _now()
+
         # Create transition record
         transition = StateTransition(
             from_state=self.current_state,
             to_state=new_state,
             validator_name=self.validator_name,
-            timestamp=time.time(),
-            metadata=metadata or {}
+            timestamp=now,
+            metadata=metadata or _EMPTY_METADATA
         )
 
         # Update state
-        old_state = self.current_state
         self.current_state = new_state
-        self._state_entered_at = time.time()
-        self._transition_history.append(transition)
+        self._state_entered_at = now
+        if self._transition_history is not None:
+            self._transition_history.append(transition)
+        self._total_transitions += 1
+        self._dirty = True
 
         return transition
 
@@ -142,12 +257,7 @@ class ValidatorStateMachine:
             "full" for ACTIVE validators
             "recovery" for INACTIVE validators
         """
-        if self.current_state == ValidatorState.NEW:
-            return "minimal"
-        elif self.current_state == ValidatorState.ACTIVE:
-            return "full"
-        else:  # INACTIVE
-            return "recovery"
+        return self.ALERT_THRESHOLDS[self.current_state]
 
     def should_alert_on(self, alert_type: str) -> bool:
         """
@@ -163,26 +273,24 @@ class ValidatorStateMachine:
         if alert_type in self.ALWAYS_ALERT_TYPES:
             return True
 
-        # For ACTIVE-only alerts, only alert if validator is ACTIVE
-        if alert_type in self.ACTIVE_ONLY_ALERT_TYPES:
-            return self.current_state == ValidatorState.ACTIVE
-
-        # Default: alert based on threshold
-        threshold = self.get_alert_threshold()
-        if threshold == "minimal":
-            return False  # Suppress most alerts for new validators
-        elif threshold == "recovery":
-            return False  # Suppress most alerts for inactive validators
-        else:
-            return True  # Full alerts for active validators
+        # ACTIVE-only alerts and every other type share the same rule: only the
+        # "full" threshold (ACTIVE) alerts; "minimal" (NEW) and "recovery"
+        # (INACTIVE) suppress them
+        return self.current_state is ValidatorState.ACTIVE
 
     def get_transition_history(self) -> List[StateTransition]:
-        """Get list of all state transitions"""
+        """
+        Get list of recent state transitions (up to MAX_TRANSITION_HISTORY).
+
+        Always empty unless the machine was created with keep_history=True.
+        """
+        if self._transition_history is None:
+            return []
         return list(self._transition_history)
 
     def get_state_duration(self) -> float:
         """Get how long the validator has been in current state (seconds)"""
-        return time.time() - self._state_entered_at
+        return _now() - self._state_entered_at
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize state to dictionary for persistence"""
@@ -190,7 +298,7 @@ class ValidatorStateMachine:
             "validator_name": self.validator_name,
             "current_state": self.current_state.value,
             "state_entered_at": self._state_entered_at,
-            "transition_count": len(self._transition_history),
+            "transition_count": self._total_transitions,
         }
 
     @classmethod
@@ -210,8 +318,6 @@ class ValidatorStateMachine:
         Returns:
             ValidatorStateMachine instance (default state if data is corrupted)
         """
-        logger = logging.getLogger(__name__)
-
         # Default values for corruption recovery
         DEFAULT_VALIDATOR_NAME = "unknown"
         DEFAULT_STATE = ValidatorState.NEW
@@ -224,65 +330,98 @@ class ValidatorStateMachine:
             )
             return cls(validator_name=DEFAULT_VALIDATOR_NAME, initial_state=DEFAULT_STATE)
 
-        # Extract validator_name with fallback
         validator_name = data.get("validator_name")
-        if not isinstance(validator_name, str) or not validator_name:
-            logger.warning(
-                f"State persistence corruption: validator_name is missing or invalid "
-                f"(value={validator_name!r}). Using default: '{DEFAULT_VALIDATOR_NAME}'"
-            )
-            validator_name = DEFAULT_VALIDATOR_NAME
-
-        # Extract and validate current_state
         current_state_value = data.get("current_state")
-        initial_state = DEFAULT_STATE
 
-        if current_state_value is not None:
-            try:
-                initial_state = ValidatorState(current_state_value)
-            except (ValueError, TypeError) as e:
+        # Well-formed payloads (the common case) resolve through a shared cache
+        fields = None
+        if type(validator_name) is str and type(current_state_value) is str:
+            fields = _validated_fields(validator_name, current_state_value)
+
+        if fields is not None:
+            validator_name, initial_state = fields
+        else:
+            # Slow path: repair each corrupted field, logging what was replaced
+            if not isinstance(validator_name, str) or not validator_name:
                 logger.warning(
-                    f"State persistence corruption: current_state is invalid "
-                    f"(value={current_state_value!r}, error={e}). "
+                    f"State persistence corruption: validator_name is missing or invalid "
+                    f"(value={validator_name!r}). Using default: '{DEFAULT_VALIDATOR_NAME}'"
+                )
+                validator_name = DEFAULT_VALIDATOR_NAME
+
+            initial_state = DEFAULT_STATE
+            if current_state_value is not None:
+                try:
+                    initial_state = ValidatorState(current_state_value)
+                except (ValueError, TypeError) as e:
+                    logger.warning(
+                        f"State persistence corruption: current_state is invalid "
+                        f"(value={current_state_value!r}, error={e}). "
+                        f"Using default state: {DEFAULT_STATE.value}"
+                    )
+                    initial_state = DEFAULT_STATE
+            else:
+                logger.warning(
+                    f"State persistence corruption: current_state is missing. "
                     f"Using default state: {DEFAULT_STATE.value}"
                 )
-                initial_state = DEFAULT_STATE
-        else:
-            logger.warning(
-                f"State persistence corruption: current_state is missing. "
-                f"Using default state: {DEFAULT_STATE.value}"
-            )
 
         # Create machine with validated data
         machine = cls(validator_name=validator_name, initial_state=initial_state)
-        machine._state_entered_at = data.get("state_entered_at", time.time())
+        # The constructor already stamped the entry time; keep it if none was saved
+        state_entered_at = data.get("state_entered_at")
+        if state_entered_at is not None:
+            machine._state_entered_at = state_entered_at
+
+        transition_count = data.get("transition_count", 0)
+        if isinstance(transition_count, int) and transition_count >= 0:
+            machine._total_transitions = transition_count
 
         return machine
 
     # Class-level constants for file persistence
     DEFAULT_STATE_FILE: ClassVar[str] = "validator_state.json"
 
+    def _saved_key(self, filepath: str) -> Tuple[Any, ...]:
+        """Snapshot of what save_state() writes, to catch direct attribute edits"""
+        return (
+            filepath,
+            self.validator_name,
+            self.current_state,
+            self._state_entered_at,
+            self._total_transitions,
+        )
+
     def save_state(self, filepath: str) -> bool:
         """
         Save state machine to JSON file.
 
+        Skipped (returning True) when nothing changed since the last successful
+        save to the same file, so per-tick calls without a transition are free.
+
         Args:
             filepath: Path to the JSON file to save state
 
         Returns:
             True if save successful, False on any error
         """
-        logger = logging.getLogger(__name__)
+        saved_key = self._saved_key(filepath)
+        if not self._dirty and saved_key == self._last_saved:
+            return True
 
         try:
             path = Path(filepath)
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            data = self.to_dict()
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            payload = _json_dumps_indented(self.to_dict())
+            with open(path, "wb") as f:
+                f.write(payload)
+
+            self._dirty = False
+            self._last_saved = saved_key
 
-            logger.debug(f"State saved for {self.validator_name} to {filepath}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("State saved for %s to %s", self.validator_name, filepath)
             return True
 
         except (OSError, IOError, PermissionError) as e:
@@ -292,6 +431,43 @@ class ValidatorStateMachine:
             logger.error(f"Failed to serialize state for {self.validator_name}: {e}")
             return False
 
+    @classmethod
+    def load_all(cls, filepath: str) -> Dict[str, "ValidatorStateMachine"]:
+        """
+        Load state machines from the aggregated JSON file written by StatePersistenceService.
+
+        Entries are deserialized with from_dict(), so a corrupted entry yields
+        a default machine (validator_name="unknown") rather than an error.
+
+        Args:
+            filepath: Path to the aggregated JSON file
+
+        Returns:
+            Dict of validator name to state machine (empty if file missing/corrupted)
+        """
+        try:
+            path = Path(filepath)
+
+            if not path.exists():
+                logger.debug(f"State file not found: {filepath}")
+                return {}
+
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
+
+            if not isinstance(data, dict):
+                logger.warning(f"State file corrupted (expected object): {filepath}")
+                return {}
+
+            return {name: cls.from_dict(entry) for name, entry in data.items()}
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"State file corrupted (invalid JSON): {filepath}. Error: {e}")
+            return {}
+        except (OSError, IOError, PermissionError) as e:
+            logger.warning(f"Failed to read state file {filepath}: {e}")
+            return {}
+
     @classmethod
     def load_state(cls, filepath: str) -> "ValidatorStateMachine":
         """
@@ -306,8 +482,6 @@ class ValidatorStateMachine:
         Returns:
             ValidatorStateMachine instance (default state if file missing/corrupted)
         """
-        logger = logging.getLogger(__name__)
-
         default_machine = cls(validator_name="unknown", initial_state=ValidatorState.NEW)
 
         try:
@@ -321,8 +495,8 @@ class ValidatorStateMachine:
                 logger.warning(f"State file is empty: {filepath}. Using default state.")
                 return default_machine
 
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
 
             return cls.from_dict(data)
 
@@ -335,3 +509,208 @@ class ValidatorStateMachine:
         except Exception as e:
             logger.error(f"Unexpected error loading state from {filepath}: {e}")
             return default_machine
+
+    @staticmethod
+    def load_transition_log(filepath: str) -> List[StateTransition]:
+        """
+        Load the transitions recorded in a transition history log.
+
+        The log is history only; state is restored from the snapshot file.
+        The rotated generation (filepath + ".1") is read first, if present.
+        Malformed lines (e.g. a line cut short by a crash mid-append) are
+        skipped rather than discarding the whole log.
+
+        Args:
+            filepath: Path to the JSONL transition log
+
+        Returns:
+            Transitions in the order they were logged (empty if file missing)
+        """
+        transitions: List[StateTransition] = []
+        for path in (f"{filepath}.1", filepath):
+            try:
+                with open(path, "rb") as f:
+                    for line_number, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        try:
+                            transitions.append(StateTransition.from_dict(_json_loads(line)))
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.warning(f"Skipping corrupted transition log line {line_number} in {path}: {e}")
+            except FileNotFoundError:
+                continue
+            except (OSError, IOError, PermissionError) as e:
+                logger.warning(f"Failed to read transition log {path}: {e}")
+        return transitions
+
+
+def _write_state_file(filepath: str, data: Dict[str, Dict[str, Any]]) -> bool:
+    """
+    Atomically write an aggregated {validator name: to_dict()} state file.
+
+    The JSON is written indented (orjson when installed) to a temporary file, fsynced and moved into
+    place with os.replace(), so readers never see a half-written file.
+
+    Returns:
+        True if save successful, False on any error
+    """
+    tmp_filepath = f"{filepath}.tmp"
+
+    try:
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload = _json_dumps_indented(data)
+        with open(tmp_filepath, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, path)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("State saved for %d validators to %s", len(data), filepath)
+        return True
+
+    except (OSError, IOError, PermissionError) as e:
+        logger.warning(f"Failed to save state to {filepath}: {e}")
+        return False
+    except (TypeError, ValueError) as e:
+        logger.error(f"Failed to serialize aggregated state: {e}")
+        return False
+
+
+def _append_transition_log(
+    filepath: str,
+    entries: List[Dict[str, Any]],
+    max_bytes: int = TRANSITION_LOG_MAX_BYTES,
+) -> bool:
+    """
+    Append transition entries to a JSONL log, one compact JSON object per line.
+
+    When the append would take the log past max_bytes, the current log is
+    first moved to filepath + ".1" (replacing the previous generation), so
+    the history never uses more than about twice max_bytes on disk.
+
+    Returns:
+        True if the append succeeded, False on any error
+    """
+    try:
+        payload = b"".join(_json_dumps(entry) + b"\n" for entry in entries)
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if os.path.getsize(filepath) + len(payload) > max_bytes:
+                os.replace(filepath, f"{filepath}.1")
+        except FileNotFoundError:
+            pass
+        with open(filepath, "ab") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        return True
+
+    except (OSError, IOError, PermissionError) as e:
+        logger.warning(f"Failed to append transitions to {filepath}: {e}")
+        return False
+    except (TypeError, ValueError) as e:
+        logger.error(f"Failed to serialize transitions: {e}")
+        return False
+
+
+# Queue sentinel asking the persistence thread to write and exit
+_STOP = object()
+
+
+class StatePersistenceService:
+    """
+    Persist state machines to the aggregated state file from a background thread.
+
+    submit() only enqueues a to_dict() snapshot, so the monitoring loop never
+    waits on the disk. The writer thread keeps the latest snapshot per
+    validator and writes the whole set with one atomic replace once the queue
+    drains, or at most every flush_interval seconds while snapshots keep
+    arriving, coalescing bursts of updates into a single write.
+
+    With a transition_log_path, transitions passed to submit() are also
+    appended to a JSONL history (see load_transition_log()), batched into one
+    append per write. The log is history only - the snapshot file stays the
+    source of truth for restoring state - and is rotated once it reaches
+    TRANSITION_LOG_MAX_BYTES.
+
+    Usage:
+        persistence = StatePersistenceService("state/validator_state.json", machines.values())
+        persistence.submit(machine, transition)   # after a state change
+        persistence.close()                       # final write on shutdown
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        machines: Iterable["ValidatorStateMachine"] = (),
+        flush_interval: float = 1.0,
+        transition_log_path: Optional[str] = None,
+    ):
+        self.filepath = filepath
+        self.flush_interval = flush_interval
+        self.transition_log_path = transition_log_path
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        # Seeded with every machine so the first write covers all validators
+        self._pending: Dict[str, Dict[str, Any]] = {
+            machine.validator_name: machine.to_dict() for machine in machines
+        }
+        self._pending_transitions: List[Dict[str, Any]] = []
+        self._last_write_ok = True
+        self._thread = threading.Thread(
+            target=self._run, name="state-persistence", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, machine: "ValidatorStateMachine", transition: Optional[StateTransition] = None
+    ) -> None:
+        """Queue a snapshot of the machine's current state (and its transition) for writing"""
+        entry = None
+        if transition is not None and self.transition_log_path is not None:
+            entry = transition.to_dict()
+        self._queue.put((machine.to_dict(), entry))
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """
+        Write any queued snapshots and stop the writer thread.
+
+        Returns:
+            True if the last write succeeded (and finished within timeout)
+        """
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        return self._last_write_ok and not self._thread.is_alive()
+
+    def _run(self) -> None:
+        dirty = False
+        last_write = 0.0
+
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if dirty else None)
+            except queue.Empty:
+                item = None  # Quiet period: write what we have
+
+            if item is not None and item is not _STOP:
+                snapshot, entry = item
+                self._pending[snapshot["validator_name"]] = snapshot
+                if entry is not None:
+                    self._pending_transitions.append(entry)
+                dirty = True
+                # More snapshots already queued: coalesce them into one write
+                if not self._queue.empty() and time.monotonic() - last_write < self.flush_interval:
+                    continue
+
+            if dirty:
+                if self._pending_transitions:
+                    _append_transition_log(self.transition_log_path, self._pending_transitions)
+                    self._pending_transitions.clear()
+                self._last_write_ok = _write_state_file(self.filepath, self._pending)
+                last_write = time.monotonic()
+                dirty = False
+
+            if item is _STOP:
+                return
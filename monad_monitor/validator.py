@@ -1,11 +1,11 @@
 """Validator health check logic"""
 
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from .config import ValidatorConfig
-from .metrics import MetricsScraper
+from .metrics import MetricsScraper, SystemMetricsCache
 
 if TYPE_CHECKING:
     from monad_monitor.huginn import HuginnClient
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Health check result"""
     is_healthy: bool
@@ -24,8 +24,8 @@ class HealthStatus:
     peers: Optional[float] = None
     is_syncing: bool = False
     rpc_healthy: Optional[bool] = None
-    warnings: List[str] = field(default_factory=list)
-    criticals: List[str] = field(default_factory=list)  # Critical resource alerts
+    warnings: Sequence[str] = ()  # Shared empty default; a list only when non-empty
+    criticals: Sequence[str] = ()  # Critical resource alerts
     is_active_validator: Optional[bool] = None  # True if in active set
     huginn_data: Optional[Dict] = None  # Huginn API uptime data
     system_metrics: Optional[Dict] = None  # CPU/RAM/Disk/TrieDB metrics
@@ -54,17 +54,33 @@ class ValidatorHealthChecker:
         thresholds: Optional[SystemThresholds] = None,
         huginn_client: Optional["HuginnClient"] = None,
         gmonads_client: Optional["GmonadsClient"] = None,
+        system_metrics_cache: Optional[SystemMetricsCache] = None,
     ):
         self.validator = validator
         self.scraper = MetricsScraper(
             metrics_url=validator.metrics_url,
             rpc_url=validator.rpc_url,
             timeout=timeout,
+            system_metrics_cache=system_metrics_cache,
         )
         self.thresholds = thresholds or SystemThresholds()
         self.huginn_client = huginn_client
         self.gmonads_client = gmonads_client
 
+    @property
+    def thresholds(self) -> SystemThresholds:
+        return self._thresholds
+
+    @thresholds.setter
+    def thresholds(self, thresholds: SystemThresholds) -> None:
+        self._thresholds = thresholds
+        # (metric key, warning, critical, label) for the percent-based checks
+        self._threshold_table: Tuple[Tuple[str, float, float, str], ...] = (
+            ("cpu_used_percent", thresholds.cpu_warning, thresholds.cpu_critical, "CPU"),
+            ("mem_percent", thresholds.memory_warning, thresholds.memory_critical, "Memory"),
+            ("disk_percent", thresholds.disk_warning, thresholds.disk_critical, "Disk"),
+        )
+
     def check(
         self,
         last_block_commits: Optional[float] = None,
@@ -85,20 +101,28 @@ class ValidatorHealthChecker:
         """
         warnings = []
 
-        # Fetch metrics
-        metrics = self.scraper.get_monad_metrics()
+        # Start the Huginn/gmonads status lookup first: it does not need this
+        # tick's metrics, so its round-trip overlaps with the scrape below
+        status_future = None
+        if self.huginn_client and self.validator.validator_secp:
+            status_future = self.scraper.submit_validator_status(
+                self.validator.validator_secp,
+                huginn_client=self.huginn_client,
+                network=self.validator.network,
+                gmonads_client=self.gmonads_client,
+            )
+
+        # Fetch metrics, RPC health and system metrics concurrently
+        metrics, rpc_healthy, scraped_system_metrics = self.scraper.scrape(
+            self.validator.node_exporter_url
+        )
 
         if "error" in metrics:
             return HealthStatus(
                 is_healthy=False,
                 message=f"Connection failed: {metrics['error']}",
-                warnings=warnings,
-                criticals=[],
             ), None, None, None, False
 
-        # Check RPC health
-        rpc_healthy = self.scraper.check_rpc_health()
-
         # Alert if RPC is unhealthy (but metrics are working)
         # This is rare but indicates RPC endpoint issues
         if not rpc_healthy:
@@ -110,16 +134,35 @@ class ValidatorHealthChecker:
         is_active_validator = None
         huginn_data = None
 
-        if self.huginn_client and self.validator.validator_secp:
+        if status_future is not None:
             validator_status = self.scraper.get_validator_status(
                 self.validator.validator_secp,
-                huginn_client=self.huginn_client,
-                network=self.validator.network,
-                gmonads_client=self.gmonads_client,
+                monad_metrics=metrics,
+                remote_status=status_future,
             )
             is_active_validator = validator_status.get("is_active")
             huginn_data = validator_status.get("huginn_data")
 
+        # Basic stats shared by every status built below
+        block_height = metrics.get("block_height")
+        peers = metrics.get("peers")
+
+        def _status(message: str, is_healthy: bool = False, criticals: Optional[List[str]] = None,
+                    **extra) -> HealthStatus:
+            return HealthStatus(
+                is_healthy=is_healthy,
+                message=message,
+                metrics=metrics,
+                block_height=block_height,
+                peers=peers,
+                rpc_healthy=rpc_healthy,
+                warnings=warnings or (),
+                criticals=criticals or (),
+                is_active_validator=is_active_validator,
+                huginn_data=huginn_data,
+                **extra,
+            )
+
         # Get ts_validation_fail for tracking
         current_ts_validation_fail = metrics.get("ts_validation_fail")
 
@@ -127,18 +170,7 @@ class ValidatorHealthChecker:
         current_commits = metrics.get("block_commits")
         if current_commits is not None and last_block_commits is not None:
             if current_commits == last_block_commits:
-                return HealthStatus(
-                    is_healthy=False,
-                    message="Node stopped producing blocks!",
-                    metrics=metrics,
-                    block_height=metrics.get("block_height"),
-                    peers=metrics.get("peers"),
-                    rpc_healthy=rpc_healthy,
-                    warnings=warnings,
-                    criticals=[],
-                    is_active_validator=is_active_validator,
-                    huginn_data=huginn_data,
-                ), current_commits, last_execution_lagging, current_ts_validation_fail, False
+                return _status("Node stopped producing blocks!"), current_commits, last_execution_lagging, current_ts_validation_fail, False
 
         # Check execution lagging - only alert if INCREASING
         current_execution_lagging = metrics.get("execution_lagging")
@@ -148,17 +180,8 @@ class ValidatorHealthChecker:
                 lag_increase = current_execution_lagging - last_execution_lagging
                 if lag_increase > 0:
                     # Execution lagging is increasing - this is a problem
-                    return HealthStatus(
-                        is_healthy=False,
-                        message=f"Execution lagging increasing: +{int(lag_increase)} (total: {int(current_execution_lagging)})",
-                        metrics=metrics,
-                        block_height=metrics.get("block_height"),
-                        peers=metrics.get("peers"),
-                        rpc_healthy=rpc_healthy,
-                        warnings=warnings,
-                        criticals=[],
-                        is_active_validator=is_active_validator,
-                        huginn_data=huginn_data,
+                    return _status(
+                        f"Execution lagging increasing: +{int(lag_increase)} (total: {int(current_execution_lagging)})"
                     ), current_commits, current_execution_lagging, current_ts_validation_fail, False
                 # else: lagging is stable or decreasing, not a problem
             # First check - just record baseline, don't warn
@@ -191,14 +214,12 @@ class ValidatorHealthChecker:
         system_metrics = None
         criticals = []
         if self.validator.node_exporter_url:
-            system_metrics = self.check_system_metrics()
+            system_metrics = scraped_system_metrics
             system_warnings, system_criticals = self._check_system_thresholds(system_metrics)
             warnings.extend(system_warnings)
             criticals.extend(system_criticals)
 
-        # Get basic stats
-        block_height = metrics.get("block_height")
-        peers = metrics.get("peers")
+        # Build sync status
         syncing_flag = metrics.get("syncing")
         sync_status = "syncing" if syncing_flag or is_syncing else "synced"
 
@@ -229,18 +250,11 @@ class ValidatorHealthChecker:
         if criticals:
             message += f" [Criticals: {len(criticals)}]"
 
-        return HealthStatus(
+        return _status(
+            message,
             is_healthy=True,
-            message=message,
-            metrics=metrics,
-            block_height=block_height,
-            peers=peers,
-            is_syncing=is_syncing,
-            rpc_healthy=rpc_healthy,
-            warnings=warnings,
             criticals=criticals,
-            is_active_validator=is_active_validator,
-            huginn_data=huginn_data,
+            is_syncing=is_syncing,
             system_metrics=system_metrics,
         ), current_commits, current_execution_lagging, current_ts_validation_fail, ts_fail_increasing
 
@@ -255,29 +269,15 @@ class ValidatorHealthChecker:
         if not system_metrics:
             return warnings, criticals
 
-        # CPU check
-        cpu_percent = system_metrics.get("cpu_used_percent")
-        if cpu_percent is not None:
-            if cpu_percent >= self.thresholds.cpu_critical:
-                criticals.append(f"CPU critical: {cpu_percent:.1f}%")
-            elif cpu_percent >= self.thresholds.cpu_warning:
-                warnings.append(f"CPU warning: {cpu_percent:.1f}%")
-
-        # Memory check
-        mem_percent = system_metrics.get("mem_percent")
-        if mem_percent is not None:
-            if mem_percent >= self.thresholds.memory_critical:
-                criticals.append(f"Memory critical: {mem_percent:.1f}%")
-            elif mem_percent >= self.thresholds.memory_warning:
-                warnings.append(f"Memory warning: {mem_percent:.1f}%")
-
-        # Disk check
-        disk_percent = system_metrics.get("disk_percent")
-        if disk_percent is not None:
-            if disk_percent >= self.thresholds.disk_critical:
-                criticals.append(f"Disk critical: {disk_percent:.1f}%")
-            elif disk_percent >= self.thresholds.disk_warning:
-                warnings.append(f"Disk warning: {disk_percent:.1f}%")
+        # CPU / memory / disk checks
+        for key, warning, critical, label in self._threshold_table:
+            value = system_metrics.get(key)
+            if value is None:
+                continue
+            if value >= critical:
+                criticals.append(f"{label} critical: {value:.1f}%")
+            elif value >= warning:
+                warnings.append(f"{label} warning: {value:.1f}%")
 
         # NVMe wear level check (per-device)
         nvme_data = system_metrics.get("nvme", {})
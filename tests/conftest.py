@@ -1,8 +1,11 @@
 """Pytest configuration and shared fixtures for Monad Validator Monitor tests"""
 
+import importlib
+import importlib.util
 import os
 import sys
-from typing import Dict, Any
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Mapping
 
 import pytest
 
@@ -74,7 +77,15 @@ node_filesystem_avail_bytes{mount="/"} 53687091200
 """
 
 
-@pytest.fixture
+def _freeze(config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Wrap a nested config dict in read-only views"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+
+@pytest.fixture(scope="session")
 def sample_validator_config() -> ValidatorConfig:
     """Create a sample validator configuration for testing"""
     return ValidatorConfig(
@@ -88,7 +99,7 @@ def sample_validator_config() -> ValidatorConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_validator_config_no_node_exporter() -> ValidatorConfig:
     """Create a validator config without node exporter"""
     return ValidatorConfig(
@@ -102,10 +113,10 @@ def sample_validator_config_no_node_exporter() -> ValidatorConfig:
     )
 
 
-@pytest.fixture
-def sample_config() -> Dict[str, Any]:
-    """Create a sample configuration dictionary"""
-    return {
+@pytest.fixture(scope="session")
+def sample_config() -> Mapping[str, Any]:
+    """Create a sample configuration (read-only: shared by the whole session)"""
+    return _freeze({
         "telegram": {
             "token": "test-telegram-token",
             "chat_id": "test-chat-id",
@@ -128,7 +139,7 @@ def sample_config() -> Dict[str, Any]:
             "disk_warning": 85,
             "disk_critical": 95,
         },
-    }
+    })
 
 
 @pytest.fixture
@@ -162,7 +173,28 @@ def health_checker(sample_validator_config) -> ValidatorHealthChecker:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def system_thresholds() -> SystemThresholds:
     """Create default system thresholds"""
     return SystemThresholds()
+
+
+@pytest.fixture
+def import_without_orjson(monkeypatch) -> Callable[[str], ModuleType]:
+    """Return a loader for a private copy of a monad_monitor module with orjson blocked
+
+    The copy runs the stdlib json fallback branch. The real module in
+    sys.modules, and the classes other tests imported from it, are left alone.
+    """
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    def load(name: str) -> ModuleType:
+        original = importlib.import_module(f"monad_monitor.{name}")
+        copy_name = f"monad_monitor._{name}_without_orjson"
+        spec = importlib.util.spec_from_file_location(copy_name, original.__file__)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, copy_name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
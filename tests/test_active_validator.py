@@ -9,11 +9,11 @@ from monad_monitor.validator import (
     SystemThresholds,
 )
 from monad_monitor.config import ValidatorConfig
-from monad_monitor.metrics import MetricsScraper
+from monad_monitor.metrics import MONAD_METRICS, MetricsScraper
 
 
 # Sample metrics responses
-HEALTHY_METRICS = """
+HEALTHY_METRICS = b"""
 monad_execution_ledger_num_commits 12345
 monad_execution_ledger_block_num 98765
 monad_state_consensus_events_local_timeout 0
@@ -23,7 +23,7 @@ monad_statesync_syncing 0
 """
 
 # Metrics with active validator
-ACTIVE_VALIDATOR_METRICS = """
+ACTIVE_VALIDATOR_METRICS = b"""
 monad_consensus_active_validators 10
 monad_bft_txpool_create_proposal 15
 monad_consensus_proposed_blocks_total 100
@@ -32,17 +32,24 @@ monad_consensus_missed_blocks_total 5
 """
 
 # Metrics with inactive validator (has local timeout)
-INACTIVE_VALIDATOR_METRICS = """
+INACTIVE_VALIDATOR_METRICS = b"""
 monad_consensus_active_validators 10
 monad_bft_txpool_create_proposal 0
 monad_state_consensus_events_local_timeout 5
 """
 
 
+# ACTIVE_VALIDATOR_METRICS as get_monad_metrics() returns it, parsed once at import
+_ACTIVE_VALUES = MetricsScraper._scan_lines(
+    ACTIVE_VALIDATOR_METRICS.decode().splitlines(), frozenset(MONAD_METRICS.values())
+)
+PARSED_ACTIVE_METRICS = {key: _ACTIVE_VALUES.get(name) for key, name in MONAD_METRICS.items()}
+
+
 class TestActiveValidatorDetection:
     """Test cases for active validator detection"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def validator_config(self):
         """Create validator config for testing"""
         return ValidatorConfig(
@@ -64,67 +71,84 @@ class TestActiveValidatorDetection:
             thresholds=SystemThresholds(),
         )
 
-    def test_get_validator_status_active(self, validator_config):
-        """Test getting validator active status when active"""
+    @pytest.fixture(scope="class")
+    def scraper(self, validator_config):
+        """Create one metrics scraper shared by the class's tests"""
+        scraper = MetricsScraper(
+            metrics_url=validator_config.metrics_url,
+            rpc_url=validator_config.rpc_url,
+        )
+        yield scraper
+        scraper.close()
+
+    @pytest.mark.parametrize(
+        "body,status_code,expected_active,reason_substr",
+        [
+            (ACTIVE_VALIDATOR_METRICS, 200, True, "proposals"),
+            # local_timeout no longer decides status (it tracks OTHER nodes'
+            # timeouts); without proposals/commits the status is unknown
+            (INACTIVE_VALIDATOR_METRICS, 200, None, "cannot determine"),
+            ("Error", 500, None, "could not fetch"),
+        ],
+        ids=["active", "unknown", "fetch_error"],
+    )
+    def test_get_validator_status(
+        self, scraper, validator_config, body, status_code, expected_active, reason_substr
+    ):
+        """Test validator status inferred from local metrics"""
         with responses.RequestsMock() as rsps:
             rsps.add(
                 responses.GET,
-                "http://192.168.1.100:8889/metrics",
-                body=ACTIVE_VALIDATOR_METRICS,
-                status=200,
+                validator_config.metrics_url,
+                body=body,
+                status=status_code,
             )
 
-            scraper = MetricsScraper(
-                metrics_url=validator_config.metrics_url,
-                rpc_url=validator_config.rpc_url,
-            )
             status = scraper.get_validator_status(validator_config.validator_secp)
 
-            assert status["is_active"] is True
-            assert "reason" in status
-            assert status["metrics_used"] != []
-
-    def test_get_validator_status_inactive(self, validator_config):
-        """Test getting validator status when cannot determine from local metrics alone
-
-        Note: local_timeout is no longer used to determine validator status because
-        it tracks OTHER nodes' timeouts, not our validator's status. When we can't
-        determine status from proposals/commits, we return None (unknown).
-        """
-        with responses.RequestsMock() as rsps:
-            rsps.add(
-                responses.GET,
-                "http://192.168.1.100:8889/metrics",
-                body=INACTIVE_VALIDATOR_METRICS,
-                status=200,
+            assert status["is_active"] is expected_active
+            assert reason_substr in status["reason"].lower()
+            if expected_active:
+                assert status["metrics_used"] != []
+
+    def test_get_validator_status_reuses_tick_metrics(self, scraper, validator_config):
+        """Test that already-parsed metrics are used without another fetch"""
+        with responses.RequestsMock():  # Any HTTP request would fail the test
+            status = scraper.get_validator_status(
+                validator_config.validator_secp,
+                monad_metrics=PARSED_ACTIVE_METRICS,
             )
 
-            scraper = MetricsScraper(
-                metrics_url=validator_config.metrics_url,
-                rpc_url=validator_config.rpc_url,
-            )
-            status = scraper.get_validator_status(validator_config.validator_secp)
+        assert status["is_active"] is True
+        assert status["proposals_count"] == 15
 
-            # Without proposals/commits and without local_timeout logic,
-            # we can't determine status from local metrics alone
-            assert status["is_active"] is None  # Unknown - cannot determine
-            assert "Cannot determine" in status["reason"] or "no proposals" in status["reason"].lower()
+    def test_get_validator_status_uses_submitted_lookup(self, validator_config):
+        """Test that a status lookup submitted earlier is reused, not repeated"""
+        from unittest.mock import MagicMock
 
-    def test_get_validator_status_fetch_error(self, validator_config):
-        """Test getting validator status when metrics fetch fails"""
-        with responses.RequestsMock() as rsps:
-            rsps.add(
-                responses.GET,
-                "http://192.168.1.100:8889/metrics",
-                body="Error",
-                status=500,
-            )
+        huginn_client = MagicMock()
+        huginn_client.get_validator_uptime.return_value = None
+        gmonads_client = MagicMock()
+        gmonads_client.is_validator_in_active_set.return_value = True
 
-            scraper = MetricsScraper(
-                metrics_url=validator_config.metrics_url,
-                rpc_url=validator_config.rpc_url,
-            )
-            status = scraper.get_validator_status(validator_config.validator_secp)
+        scraper = MetricsScraper(
+            metrics_url=validator_config.metrics_url,
+            rpc_url=validator_config.rpc_url,
+        )
+        remote_status = scraper.submit_validator_status(
+            validator_config.validator_secp,
+            huginn_client=huginn_client,
+            gmonads_client=gmonads_client,
+        )
+        status = scraper.get_validator_status(
+            validator_config.validator_secp,
+            huginn_client=huginn_client,
+            gmonads_client=gmonads_client,
+            remote_status=remote_status,
+        )
+        scraper.close()
 
-            assert status["is_active"] is None  # Unknown
-            assert "Could not fetch" in status["reason"]
+        assert status["is_active"] is True
+        assert status["source"] == "gmonads_api"
+        huginn_client.get_validator_uptime.assert_called_once()
+        gmonads_client.is_validator_in_active_set.assert_called_once()
@@ -1,8 +1,12 @@
 """Tests for AlertHandler and alert functionality"""
 
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
+import requests
 import responses
 
 from monad_monitor.alerts import AlertHandler
@@ -35,6 +39,46 @@ class TestAlertHandler:
 
             assert result is True
 
+    def test_send_telegram_posts_json_body(self, handler):
+        """Test Telegram payload is sent as a JSON body"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "https://api.telegram.org/bottest-telegram-token/sendMessage",
+                json={"ok": True},
+                status=200,
+            )
+
+            handler.send_telegram("Test ✅ message")
+
+            request = rsps.calls[0].request
+            assert request.headers["Content-Type"] == "application/json"
+            body = json.loads(request.body)
+            assert body["chat_id"] == "test-chat-id"
+            assert body["text"] == "Test ✅ message"
+
+    def test_send_telegram_posts_json_body_without_orjson(self, import_without_orjson):
+        """Test the stdlib json fallback builds the same Telegram JSON body"""
+        alerts = import_without_orjson("alerts")
+        handler = alerts.AlertHandler(
+            telegram_token="test-telegram-token",
+            telegram_chat_id="test-chat-id",
+        )
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "https://api.telegram.org/bottest-telegram-token/sendMessage",
+                json={"ok": True},
+                status=200,
+            )
+
+            assert handler.send_telegram("Test ✅ message") is True
+
+            body = json.loads(rsps.calls[0].request.body)
+            assert body["chat_id"] == "test-chat-id"
+            assert body["text"] == "Test ✅ message"
+        handler.close()
+
     def test_send_telegram_no_credentials(self):
         """Test Telegram send with no credentials"""
         handler = AlertHandler(
@@ -58,6 +102,46 @@ class TestAlertHandler:
             result = handler.send_telegram("Test message")
             assert result is False
 
+    def test_send_telegram_retries_transient_server_error(self, handler):
+        """Test a transient 5xx is retried on the session instead of failing the send"""
+        with responses.RequestsMock() as rsps:
+            url = "https://api.telegram.org/bottest-telegram-token/sendMessage"
+            rsps.add(responses.POST, url, json={"ok": False}, status=503)
+            rsps.add(responses.POST, url, json={"ok": True}, status=200)
+
+            result = handler.send_telegram("Test message")
+
+            assert result is True
+            assert len(rsps.calls) == 2
+
+    def test_read_timeout_is_not_resent(self, handler):
+        """Test a POST the API may have accepted is not retried after a read timeout"""
+        received = []
+
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append(self.rfile.read(int(self.headers["Content-Length"])))
+                time.sleep(0.3)  # Longer than the client's read timeout
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                handler._post(
+                    f"http://127.0.0.1:{server.server_port}/sendMessage",
+                    data=b"{}",
+                    timeout=(1, 0.1),
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(received) == 1
+
     def test_send_pushover_success(self, handler):
         """Test successful Pushover message send"""
         with responses.RequestsMock() as rsps:
@@ -168,7 +252,11 @@ class TestAlertHandler:
             handler.alert_critical("Critical message")
 
             # Check Pushover request has priority 2
-            pushover_call = rsps.calls[1]
+            # Channels are sent concurrently, so pick the Pushover call by URL
+            pushover_call = next(
+                call for call in rsps.calls
+                if call.request.url == "https://api.pushover.net/1/messages.json"
+            )
             body = json.loads(pushover_call.request.body)
             assert body.get("priority") == 2
 
@@ -193,6 +281,29 @@ class TestAlertHandler:
             assert body.get("retry") == 30
             assert body.get("expire") == 3600
 
+    def test_pushover_critical_cooldown_per_validator(self, handler):
+        """Test a second emergency Pushover for the same validator is suppressed until reset"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "https://api.pushover.net/1/messages.json",
+                json={"status": 1},
+                status=200,
+            )
+
+            def page(validator_name):
+                return handler.send_pushover(
+                    "Down", priority=2, bypass_rate_limit=True, validator_name=validator_name
+                )
+
+            assert page("val1") is True
+            assert page("val1") is False
+            assert page("val2") is True
+
+            handler.reset_pushover_cooldown("val1")
+            assert page("val1") is True
+            assert len(rsps.calls) == 3
+
     def test_alert_critical_uses_persistent_sound(self, handler):
         """Test alert_critical uses persistent sound for emergency"""
         with responses.RequestsMock() as rsps:
@@ -213,7 +324,11 @@ class TestAlertHandler:
 
             handler.alert_critical("Critical message")
 
-            pushover_call = rsps.calls[1]
+            # Channels are sent concurrently, so pick the Pushover call by URL
+            pushover_call = next(
+                call for call in rsps.calls
+                if call.request.url == "https://api.pushover.net/1/messages.json"
+            )
             body = json.loads(pushover_call.request.body)
             assert body.get("sound") == "persistent"
             assert body.get("priority") == 2
@@ -336,6 +451,26 @@ class TestCriticalAlertBypass:
             result = handler.alert_critical("Test critical")
             assert result is True
 
+    def test_alert_critical_sends_inline_after_close(self, handler):
+        """Test that alert_critical still sends once the alert workers are shut down"""
+        handler.close()
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "https://api.telegram.org/bottest-telegram-token/sendMessage",
+                json={"ok": True},
+                status=200,
+            )
+            rsps.add(
+                responses.POST,
+                "https://api.pushover.net/1/messages.json",
+                json={"status": 1},
+                status=200,
+            )
+
+            assert handler.alert_critical("Late critical") is True
+            assert len(rsps.calls) == 2
+
     def test_alert_critical_returns_false_on_all_failures(self, handler):
         """Test that alert_critical returns False when all channels fail"""
         with responses.RequestsMock() as rsps:
@@ -488,6 +623,7 @@ class TestFailedAlertRetry:
             result = handler.alert_critical("Test critical", validator_name="TestValidator")
             assert result is False
             assert handler.get_failed_queue_size() == 1
+            assert handler.get_critical_stats()["critical_alerts_dropped"] == 1
 
     def test_retry_failed_alerts_succeeds(self, handler):
         """Test that retry_failed_alerts sends queued alerts"""
@@ -567,6 +703,35 @@ class TestFailedAlertRetry:
             # Still in queue
             assert handler.get_failed_queue_size() == 1
 
+    def test_retry_combines_queued_alerts(self, handler):
+        """Test that queued alerts are retried as one chat message but paged individually"""
+        for i in range(3):
+            handler._queue_failed_alert(f"msg{i}", f"val{i}")
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "https://api.telegram.org/bottest-telegram-token/sendMessage",
+                json={"ok": True},
+                status=200,
+            )
+            rsps.add(
+                responses.POST,
+                "https://api.pushover.net/1/messages.json",
+                json={"status": 1},
+                status=200,
+            )
+
+            sent = handler.retry_failed_alerts()
+
+            assert sent == 3
+            assert handler.get_failed_queue_size() == 0
+            telegram_calls = [call for call in rsps.calls if "telegram" in call.request.url]
+            assert len(telegram_calls) == 1
+            text = json.loads(telegram_calls[0].request.body)["text"]
+            assert "[val0] msg0" in text and "[val2] msg2" in text
+            assert len(rsps.calls) == 4  # 1 Telegram + 3 Pushover
+
     def test_queue_size_limit(self):
         """Test that queue has a maximum size"""
         handler = AlertHandler(
@@ -575,9 +740,9 @@ class TestFailedAlertRetry:
         )
 
         # Directly fill queue to max
-        from monad_monitor.alerts import MAX_FAILED_ALERTS_QUEUE_SIZE
+        from monad_monitor.alerts import MAX_FAILED_ALERTS_QUEUE_SIZE, FailedAlert
         for i in range(MAX_FAILED_ALERTS_QUEUE_SIZE):
-            handler._failed_alerts_queue.append((f"msg{i}", f"val{i}", 0))
+            handler._failed_alerts_queue.append(FailedAlert(f"msg{i}", f"val{i}", 0))
 
         # Queue is at max
         assert len(handler._failed_alerts_queue) == MAX_FAILED_ALERTS_QUEUE_SIZE
@@ -588,9 +753,25 @@ class TestFailedAlertRetry:
         # Should have dropped oldest to stay at limit
         assert len(handler._failed_alerts_queue) == MAX_FAILED_ALERTS_QUEUE_SIZE
         # Oldest should be gone
-        assert handler._failed_alerts_queue[0][0] == "msg1"  # msg0 was dropped
+        assert handler._failed_alerts_queue[0].message == "msg1"  # msg0 was dropped
         # Newest should be present
-        assert handler._failed_alerts_queue[-1][0] == "new msg"
+        assert handler._failed_alerts_queue[-1].message == "new msg"
+
+    def test_duplicate_failed_alert_not_queued_twice(self):
+        """Test that re-failing the same alert keeps a single queue entry"""
+        handler = AlertHandler(
+            telegram_token="test",
+            telegram_chat_id="test",
+        )
+
+        handler._queue_failed_alert("down", "val1")
+        first_failed_at = handler._failed_alerts_queue[0].failed_at
+        handler._queue_failed_alert("down", "val1")
+        handler._queue_failed_alert("down", "val2")
+
+        assert handler.get_failed_queue_size() == 2
+        # The original entry keeps its age so it still goes stale
+        assert handler._failed_alerts_queue[0] == ("down", "val1", first_failed_at)
 
     def test_successful_alert_not_queued(self, handler):
         """Test that successful alerts are not queued"""
@@ -4,6 +4,7 @@ import os
 from unittest.mock import patch, mock_open
 
 import pytest
+import yaml
 
 from monad_monitor.config import (
     ValidatorConfig,
@@ -135,6 +136,11 @@ validators:
     enabled: false
 """
 
+    @pytest.fixture(scope="class")
+    def validators_data(self):
+        """VALIDATORS_YAML parsed once; load_validators() only reads it"""
+        return yaml.safe_load(self.VALIDATORS_YAML)
+
     def test_load_validators_returns_list(self):
         """Test load_validators returns a list"""
         with patch("builtins.open", mock_open(read_data=self.VALIDATORS_YAML)):
@@ -143,11 +149,10 @@ validators:
 
         assert isinstance(result, list)
 
-    def test_load_validators_filters_disabled(self):
+    def test_load_validators_filters_disabled(self, validators_data):
         """Test load_validators filters out disabled validators"""
-        with patch("builtins.open", mock_open(read_data=self.VALIDATORS_YAML)):
-            with patch.dict(os.environ, {"VALIDATORS_PATH": "test.yaml"}):
-                result = load_validators()
+        with patch("monad_monitor.config._load_yaml", return_value=validators_data):
+            result = load_validators()
 
         # Only validator-1 and validator-2 should be loaded
         assert len(result) == 2
@@ -158,15 +163,10 @@ validators:
 
     def test_load_validators_uses_defaults(self):
         """Test load_validators uses default values for missing fields"""
-        yaml_content = """
-validators:
-  - name: validator-defaults
-    host: 10.0.0.1
-"""
+        data = {"validators": [{"name": "validator-defaults", "host": "10.0.0.1"}]}
 
-        with patch("builtins.open", mock_open(read_data=yaml_content)):
-            with patch.dict(os.environ, {"VALIDATORS_PATH": "test.yaml"}):
-                result = load_validators()
+        with patch("monad_monitor.config._load_yaml", return_value=data):
+            result = load_validators()
 
         assert len(result) == 1
         validator = result[0]
@@ -376,6 +376,31 @@ class TestValidateValidators:
             validate_validators(validators)
         assert "validator_secp" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        "secp",
+        [
+            "0x1234",  # Too short to identify a validator
+            "02xyz999def111abc123def456789abc123def456789abc123def456789abc123def",  # Not hex
+            "02abc123def456789abc123def456789abc123def456789abc123def456789abc12 def",
+        ],
+    )
+    def test_validate_validators_invalid_secp(self, secp):
+        """Test validation fails when validator_secp is not a hex public key"""
+        validators = [
+            ValidatorConfig(
+                name="test",
+                host="192.168.1.1",
+                metrics_port=8889,
+                rpc_port=8080,
+                node_exporter_port=None,
+                validator_secp=secp,
+                enabled=True,
+            )
+        ]
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_validators(validators)
+        assert "invalid validator_secp" in str(exc_info.value)
+
     def test_validate_validators_valid(self):
         """Test validation passes with valid validators"""
         validators = [
@@ -1,6 +1,9 @@
 """Tests for gmonads API client"""
 
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import responses
 
@@ -161,6 +164,26 @@ class TestGmonadsClient:
             # Same fetched_at means cached
             assert result1[0].fetched_at == result2[0].fetched_at
 
+    def test_concurrent_cold_cache_fetches_once(self, client):
+        """Concurrent callers on a cold cache should share one request"""
+        def slow_epoch(request):
+            time.sleep(0.05)
+            return (200, {}, json.dumps(SAMPLE_EPOCH_VALIDATORS))
+
+        with responses.RequestsMock() as rsps:
+            rsps.add_callback(
+                responses.GET,
+                f"{BASE_URL}/validators/epoch",
+                callback=slow_epoch,
+                content_type="application/json",
+            )
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: client.get_epoch_validators("testnet"), range(4)))
+
+            assert len(rsps.calls) == 1
+            assert all(r is results[0] for r in results)
+
     def test_get_epoch_validators_error_returns_cached(self, client):
         """Should return cached data on error"""
         with responses.RequestsMock() as rsps:
@@ -276,6 +299,28 @@ class TestGmonadsClient:
 
             assert result is None
 
+    def test_is_validator_in_active_set_uncompressed_key(self, client):
+        """Should match an uncompressed key against compressed node_ids, fetching once"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                f"{BASE_URL}/validators/epoch",
+                json=SAMPLE_EPOCH_VALIDATORS,
+                status=200,
+            )
+
+            # Uncompressed form of the first (active) node_id
+            secp = (
+                "0x0403a26b820dafdb794f1fc7117ba8e897830b184dcb08e45a44262f018deabaf3"
+                "a3304676e04db4b15df81e229434dd10370681713150f404104ceadb89560d1a"
+            )
+            assert client.is_validator_in_active_set(secp, "testnet") is True
+            assert client.is_validator_in_active_set(
+                "039999999999999999999999999999999999999999999999999999999999999999", "testnet"
+            ) is False
+
+            assert len(rsps.calls) == 1
+
     def test_get_active_validator_count(self, client):
         """Should count active validators"""
         with responses.RequestsMock() as rsps:
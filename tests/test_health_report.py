@@ -8,6 +8,7 @@ import responses
 from monad_monitor.alerts import AlertHandler
 from monad_monitor.config import ValidatorConfig
 from monad_monitor.health_report import HealthReporter
+from monad_monitor.validator import HealthStatus
 
 
 class TestHealthReporter:
@@ -62,14 +63,10 @@ class TestHealthReporter:
             "validator-1": {
                 "fails": 0,
                 "alert_active": False,
-                "last_height": 100000,
-                "last_peers": 25,
             },
             "validator-2": {
                 "fails": 3,
                 "alert_active": True,
-                "last_height": 99000,
-                "last_peers": 10,
             },
         }
 
@@ -137,6 +134,35 @@ class TestHealthReporter:
             body_str = str(request_body)
             assert "Summary" in body_str or "Healthy" in body_str or "Unhealthy" in body_str
 
+    def test_send_report_shows_last_known_height_and_peers(
+        self, reporter, sample_validators, sample_states
+    ):
+        """Test report shows height/peers from the last status that carried metrics"""
+        latest = {
+            "validator-1": HealthStatus(
+                is_healthy=True,
+                message="OK",
+                metrics={"height": 100000},
+                block_height=100000,
+                peers=25,
+            ),
+        }
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "https://api.telegram.org/bottest-telegram-token/sendMessage",
+                json={"ok": True},
+                status=200,
+            )
+
+            reporter.maybe_send_report(sample_validators, sample_states, latest)
+
+            body_str = str(rsps.calls[0].request.body)
+            assert "Height: 100000" in body_str
+            assert "Peers: 25" in body_str
+            # validator-2 has no successful check yet, so only one height line
+            assert body_str.count("Height:") == 1
+
     def test_send_startup_report(self, reporter, sample_validators):
         """Test startup report is sent correctly"""
         with responses.RequestsMock() as rsps:
@@ -230,8 +256,6 @@ class TestHealthReporterExtendedReport:
             "validator-1": {
                 "fails": 0,
                 "alert_active": False,
-                "last_height": 100000,
-                "last_peers": 25,
             },
         }
 
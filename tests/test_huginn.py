@@ -1,6 +1,9 @@
 """Tests for Huginn API client with multi-network support"""
 
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import responses
 
@@ -89,6 +92,20 @@ class TestCircuitBreaker:
         assert cb.can_execute() is True
         assert cb.state == CircuitState.HALF_OPEN
 
+    def test_concurrent_failures_are_all_counted(self):
+        """Failures recorded from several threads should not be lost"""
+        cb = CircuitBreaker(failure_threshold=1000)
+
+        def fail_many(_):
+            for _ in range(200):
+                cb.record_failure()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(fail_many, range(8)))
+
+        assert cb.failure_count == 1600
+        assert cb.state == CircuitState.OPEN
+
 
 class TestHuginnConfig:
     """Test cases for HuginnConfig dataclass"""
@@ -184,6 +201,30 @@ class TestHuginnClientMultiNetwork:
             assert result.is_active is True
             assert result.total_events == 1500
 
+    def test_concurrent_cold_cache_fetches_once(self, client):
+        """Concurrent checks of one validator should share a single request"""
+        secp = "0x1234567890abcdef"
+
+        def slow_uptime(request):
+            time.sleep(0.05)
+            return (200, {}, json.dumps(SAMPLE_ACTIVE_VALIDATOR_RESPONSE))
+
+        with responses.RequestsMock() as rsps:
+            rsps.add_callback(
+                responses.GET,
+                f"{TESTNET_API}/validator/uptime/{secp}",
+                callback=slow_uptime,
+                content_type="application/json",
+            )
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(
+                    lambda _: client.get_validator_uptime(secp, network="testnet"), range(4)
+                ))
+
+            assert len(rsps.calls) == 1
+            assert all(r is results[0] for r in results)
+
     def test_client_uses_mainnet_endpoint(self, client):
         """Client should route to mainnet endpoint when network=mainnet"""
         secp = "0xabcdef1234567890"
@@ -1,9 +1,12 @@
 """Tests for MetricsScraper and metric parsing"""
 
+import json
+
 import pytest
 import responses
+import urllib3
 
-from monad_monitor.metrics import MetricsScraper
+from monad_monitor.metrics import MONAD_METRICS, MetricsScraper, SystemMetricsCache
 
 
 # Sample Prometheus metrics response
@@ -71,7 +74,7 @@ nvme_temperature_celsius{device="nvme1n1"} 24
 class TestMetricsScraper:
     """Test cases for MetricsScraper"""
 
-    def test_fetch_metrics_success(self, sample_validator_config):
+    def test_get_monad_metrics_fetches_endpoint(self, sample_validator_config):
         """Test successful metrics fetch"""
         with responses.RequestsMock() as rsps:
             rsps.add(
@@ -85,12 +88,12 @@ class TestMetricsScraper:
                 metrics_url=sample_validator_config.metrics_url,
                 rpc_url=sample_validator_config.rpc_url,
             )
-            result = scraper.fetch_metrics()
+            result = scraper.get_monad_metrics()
 
-            assert result is not None
-            assert "monad_execution_ledger_num_commits" in result
+            assert "error" not in result
+            assert result["block_commits"] == 12345.0
 
-    def test_fetch_metrics_failure(self, sample_validator_config):
+    def test_get_monad_metrics_http_error(self, sample_validator_config):
         """Test metrics fetch handles failure"""
         with responses.RequestsMock() as rsps:
             rsps.add(
@@ -104,9 +107,9 @@ class TestMetricsScraper:
                 metrics_url=sample_validator_config.metrics_url,
                 rpc_url=sample_validator_config.rpc_url,
             )
-            result = scraper.fetch_metrics()
+            result = scraper.get_monad_metrics()
 
-            assert result is None
+            assert result == {"error": "Could not fetch metrics"}
 
     def test_parse_metric_integer(self, metrics_scraper):
         """Test parsing integer metric value"""
@@ -204,6 +207,53 @@ monad_test_metric{version="new"} 200"""
         # Both have timestamp=0, max returns first found with same key
         assert result in (100.0, 200.0)
 
+    def test_parse_metric_reuses_compiled_pattern(self, metrics_scraper):
+        """Test that the per-metric pattern is compiled once and cached"""
+        from monad_monitor.metrics import _metric_pattern
+
+        metrics_scraper.parse_metric("monad_cache_metric 1", "monad_cache_metric")
+        pattern = _metric_pattern("monad_cache_metric")
+        result = metrics_scraper.parse_metric("monad_cache_metric 2", "monad_cache_metric")
+
+        assert result == 2.0
+        assert _metric_pattern("monad_cache_metric") is pattern
+
+    def test_scan_extracts_wanted_metrics_in_one_pass(self, metrics_scraper):
+        """Test _scan_lines matches parse_metric for labels, prefixes and NaN"""
+        raw = """# HELP monad_a Test metric
+monad_a{node="x"} 1.5e3
+monad_ab 99
+monad_b NaN
+monad_c 7
+"""
+        result = metrics_scraper._scan_lines(raw.splitlines(), frozenset({"monad_a", "monad_b", "monad_d"}))
+
+        assert result == {"monad_a": 1500.0, "monad_b": None}
+
+    def test_scan_stops_after_last_wanted_metric(self, metrics_scraper):
+        """Test _scan_lines stops consuming lines once all wanted metrics are complete"""
+        consumed = []
+
+        def lines():
+            for line in ["monad_a 1", "monad_a{v=\"2\"} 2 5", "monad_b 3", "monad_c 4", "monad_d 5"]:
+                consumed.append(line)
+                yield line
+
+        result = metrics_scraper._scan_lines(lines(), frozenset({"monad_a"}))
+
+        assert result == {"monad_a": 2.0}
+        assert consumed == ["monad_a 1", "monad_a{v=\"2\"} 2 5", "monad_b 3"]
+
+    def test_scan_prefers_highest_timestamp(self, metrics_scraper):
+        """Test _scan_lines picks the most recent series like parse_metric"""
+        raw = """monad_x{v="old"} 10 1000
+monad_x{v="new"} 20 3000
+monad_x{v="mid"} 15 2000
+"""
+        result = metrics_scraper._scan_lines(raw.splitlines(), frozenset({"monad_x"}))
+
+        assert result["monad_x"] == metrics_scraper.parse_metric(raw, "monad_x") == 20.0
+
     def test_get_monad_metrics_returns_dict(self, sample_validator_config):
         """Test get_monad_metrics returns dictionary"""
         with responses.RequestsMock() as rsps:
@@ -245,6 +295,42 @@ monad_test_metric{version="new"} 200"""
             assert result["local_timeout"] == 0.0
             assert result["peers"] == 25.0
 
+    @pytest.mark.parametrize("tail_lines, drained", [(10, True), (20000, False)])
+    def test_get_monad_metrics_drains_only_short_tail(
+        self, sample_validator_config, monkeypatch, tail_lines, drained
+    ):
+        """Test a long unread tail is dropped with the connection instead of drained"""
+        drain_calls = []
+        original_drain = urllib3.response.HTTPResponse.drain_conn
+
+        def spy_drain(raw):
+            drain_calls.append(raw)
+            original_drain(raw)
+
+        monkeypatch.setattr(urllib3.response.HTTPResponse, "drain_conn", spy_drain)
+        # Every wanted metric comes first, so the scan stops at the tail
+        head = "".join(f"{name} 7\n" for name in MONAD_METRICS.values())
+        body = (head + "node_unrelated_metric 1\n" * tail_lines).encode()
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                "http://192.168.1.100:8889/metrics",
+                body=body,
+                status=200,
+                headers={"Content-Length": str(len(body))},
+            )
+
+            scraper = MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+            result = scraper.get_monad_metrics()
+            scraper.close()
+
+        assert result["block_height"] == 7.0
+        assert bool(drain_calls) is drained
+
     def test_get_monad_metrics_handles_error(self, sample_validator_config):
         """Test get_monad_metrics handles fetch errors"""
         with responses.RequestsMock() as rsps:
@@ -263,6 +349,24 @@ monad_test_metric{version="new"} 200"""
 
             assert "error" in result
 
+    def test_get_monad_metrics_empty_body_is_error(self, sample_validator_config):
+        """Test get_monad_metrics treats an empty streamed body as a failed fetch"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                "http://192.168.1.100:8889/metrics",
+                body="",
+                status=200,
+            )
+
+            scraper = MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+            result = scraper.get_monad_metrics()
+
+            assert "error" in result
+
 
 class TestMetricsScraperRPCHealth:
     """Test RPC health check functionality"""
@@ -321,6 +425,66 @@ class TestMetricsScraperRPCHealth:
 
             assert result is False
 
+    def test_check_rpc_health_invalid_json(self, sample_validator_config):
+        """Test RPC health check treats a non-JSON response as unhealthy"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "http://192.168.1.100:8080",
+                body="<html>gateway</html>",
+                status=200,
+            )
+
+            scraper = MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+
+            assert scraper.check_rpc_health() is False
+
+    @pytest.mark.parametrize("body, expected", [
+        ('{"jsonrpc": "2.0", "result": "0x123456", "id": 1}', True),
+        ("<html>gateway</html>", False),
+    ])
+    def test_check_rpc_health_without_orjson(
+        self, sample_validator_config, import_without_orjson, body, expected
+    ):
+        """Test the stdlib json fallback parses RPC responses like orjson"""
+        metrics = import_without_orjson("metrics")
+        assert metrics._json_loads is json.loads
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.POST, "http://192.168.1.100:8080", body=body, status=200)
+
+            scraper = metrics.MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+            assert scraper.check_rpc_health() is expected
+            scraper.close()
+
+    def test_check_rpc_health_sends_json_payload(self, sample_validator_config):
+        """Test RPC health check posts eth_blockNumber with keep-alive"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                "http://192.168.1.100:8080",
+                json={"jsonrpc": "2.0", "result": "0x1", "id": 1},
+                status=200,
+            )
+
+            scraper = MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+            assert scraper.check_rpc_health() is True
+            scraper.close()
+
+            request = rsps.calls[0].request
+            assert json.loads(request.body)["method"] == "eth_blockNumber"
+            assert request.headers["Content-Type"] == "application/json"
+            assert request.headers["Connection"] == "keep-alive"
+
 
 class TestMetricsScraperSystemMetrics:
     """Test system metrics parsing from Node Exporter"""
@@ -372,6 +536,34 @@ class TestMetricsScraperSystemMetrics:
 
             assert result == {}
 
+    def test_get_system_metrics_shared_between_scrapers(self, sample_validator_config):
+        """Test scrapers sharing a SystemMetricsCache fetch a node exporter once"""
+        cache = SystemMetricsCache()
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                "http://192.168.1.100:9100/metrics",
+                body=NODE_EXPORTER_METRICS,
+                status=200,
+            )
+
+            scrapers = [
+                MetricsScraper(
+                    metrics_url=sample_validator_config.metrics_url,
+                    rpc_url=sample_validator_config.rpc_url,
+                    system_metrics_cache=cache,
+                )
+                for _ in range(2)
+            ]
+            results = [
+                scraper.get_system_metrics("http://192.168.1.100:9100/metrics")
+                for scraper in scrapers
+            ]
+
+            assert len(rsps.calls) == 1
+            assert results[0] == results[1]
+            assert "mem_percent" in results[0]
+
     def test_parse_cpu_idle(self, metrics_scraper):
         """Test CPU idle percentage calculation"""
         raw = """
@@ -397,6 +589,66 @@ node_filesystem_avail_bytes{device="/dev/sda1",fstype="ext4",mountpoint="/"} 250
         assert result["used"] == 75000.0
         assert result["percent"] == 75.0
 
+    def test_parse_triedb_metrics(self, metrics_scraper):
+        """Test TrieDB labelled and label-free metrics parsing"""
+        raw = """
+monad_triedb_used_bytes{drive="triedb"} 4.0e+11
+monad_triedb_capacity_bytes{drive="triedb"} 1.6e+12
+monad_triedb_avail_bytes{drive="triedb"} 1.2e+12
+monad_triedb_used_percent{drive="triedb"} 25
+monad_triedb_fast_chunks 120
+monad_triedb_slow_chunks 30
+monad_triedb_free_chunks 850
+monad_triedb_history_count 1000
+monad_triedb_history_max 2000
+"""
+        result = metrics_scraper._parse_triedb_metrics(raw)
+
+        assert result["used_bytes"] == 4.0e11
+        assert result["capacity_bytes"] == 1.6e12
+        assert result["avail_bytes"] == 1.2e12
+        assert result["used_percent"] == 25.0
+        assert result["fast_chunks"] == 120
+        assert result["slow_chunks"] == 30
+        assert result["free_chunks"] == 850
+        assert result["history_count"] == 1000
+        assert result["history_max"] == 2000
+
+    def test_scrape_combines_all_endpoints(self, sample_validator_config):
+        """Test scrape returns metrics, RPC health and system metrics together"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                "http://192.168.1.100:8889/metrics",
+                body=SAMPLE_METRICS,
+                status=200,
+            )
+            rsps.add(
+                responses.POST,
+                "http://192.168.1.100:8080",
+                json={"jsonrpc": "2.0", "result": "0x1", "id": 1},
+                status=200,
+            )
+            rsps.add(
+                responses.GET,
+                "http://192.168.1.100:9100/metrics",
+                body=NODE_EXPORTER_METRICS,
+                status=200,
+            )
+
+            scraper = MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+            metrics, rpc_healthy, system_metrics = scraper.scrape(
+                "http://192.168.1.100:9100/metrics"
+            )
+            scraper.close()
+
+            assert metrics["block_height"] == 98765.0
+            assert rpc_healthy is True
+            assert system_metrics["mem_total"] == 16777216000.0
+
 
 class TestGetValidatorStatusGmonadsFallback:
     """Test get_validator_status gmonads fallback when Huginn is unavailable"""
@@ -559,6 +811,31 @@ class TestGetValidatorStatusGmonadsFallback:
             # Should fall back to local inference
             assert result["source"] == "inference"
 
+    def test_inference_reuses_supplied_monad_metrics(self, sample_validator_config):
+        """Test that inference uses this tick's metrics instead of fetching again"""
+        from unittest.mock import MagicMock
+
+        # No endpoint registered: any HTTP request would fail the test
+        with responses.RequestsMock():
+            scraper = MetricsScraper(
+                metrics_url=sample_validator_config.metrics_url,
+                rpc_url=sample_validator_config.rpc_url,
+            )
+
+            mock_huginn = MagicMock()
+            mock_huginn.get_validator_uptime.return_value = None
+
+            result = scraper.get_validator_status(
+                validator_secp="02abc123",
+                huginn_client=mock_huginn,
+                network="testnet",
+                monad_metrics={"proposals": 7.0, "block_commits": 12345.0},
+            )
+
+            assert result["source"] == "inference"
+            assert result["is_active"] is True
+            assert result["proposals_count"] == 7
+
 
 class TestNvmeMetrics:
     def test_parse_nvme_metrics_multi_device(self):
@@ -3,7 +3,7 @@
 import time
 import pytest
 
-from monad_monitor.rate_limiter import TokenBucketRateLimiter
+from monad_monitor.rate_limiter import TokenBucketRateLimiter, reset_singletons
 
 
 class TestTokenBucketRateLimiter:
@@ -62,6 +62,16 @@ class TestTokenBucketRateLimiter:
         limiter._refill()
         assert limiter.tokens <= 10
 
+    def test_refill_skips_negligible_elapsed_time(self):
+        """Test that back-to-back refills keep accumulating elapsed time"""
+        limiter = TokenBucketRateLimiter(max_tokens=10, refill_rate=1.0)
+        limiter.consume(5)
+        last_refill = limiter.last_refill
+
+        limiter._refill()
+        assert limiter.last_refill == last_refill
+        assert limiter.tokens == 5
+
     def test_remaining_tokens(self):
         """Test remaining_tokens method"""
         limiter = TokenBucketRateLimiter(max_tokens=10, refill_rate=1.0)
@@ -123,6 +133,20 @@ class TestTokenBucketRateLimiter:
         assert limiter.max_tokens == 5
         assert limiter.refill_rate == pytest.approx(5.0 / 60.0, rel=0.1)
 
+    def test_factory_limiters_are_shared(self):
+        """Test factory methods hand back one limiter per API until reset"""
+        reset_singletons()
+        telegram = TokenBucketRateLimiter.telegram_rate_limiter()
+        telegram.consume(3)
+
+        assert TokenBucketRateLimiter.telegram_rate_limiter() is telegram
+        assert TokenBucketRateLimiter.pushover_rate_limiter() is not telegram
+
+        reset_singletons()
+        fresh = TokenBucketRateLimiter.telegram_rate_limiter()
+        assert fresh is not telegram
+        assert fresh.tokens == 10
+
     def test_consume_or_wait_returns_true_immediately(self):
         """Test consume_or_wait returns True immediately when tokens available"""
         limiter = TokenBucketRateLimiter(max_tokens=10, refill_rate=1.0)
@@ -137,6 +161,18 @@ class TestTokenBucketRateLimiter:
         result = limiter.consume_or_wait(1, max_wait=0.1)  # Would need ~100s to refill
         assert result is False
 
+    def test_consume_or_wait_reserves_and_waits(self):
+        """Test consume_or_wait reserves tokens and waits for them to accrue"""
+        limiter = TokenBucketRateLimiter(max_tokens=1, refill_rate=10.0)  # 1 token per 0.1s
+        limiter.consume(1)
+
+        start = time.monotonic()
+        assert limiter.consume_or_wait(1, max_wait=1.0) is True
+        assert 0.05 <= time.monotonic() - start < 0.5
+
+        # The reservation was paid off by the refill during the wait
+        assert -0.1 <= limiter.remaining_tokens() <= 0.1
+
     def test_reset_bucket(self):
         """Test reset functionality"""
         limiter = TokenBucketRateLimiter(max_tokens=10, refill_rate=1.0)
@@ -1,10 +1,13 @@
 """Tests for Validator State Machine"""
 
+import sys
+
 import pytest
 from monad_monitor.state_machine import (
     ValidatorState,
     ValidatorStateMachine,
     StateTransition,
+    StatePersistenceService,
 )
 
 
@@ -199,6 +202,12 @@ class TestValidatorStateMachine:
         machine.update(is_active=False, is_ever_active=True)
         assert machine.get_alert_threshold() == "recovery"
 
+    def test_get_alert_threshold_follows_restored_state(self):
+        """Test alert threshold tracks current_state set directly (startup restore)"""
+        machine = ValidatorStateMachine(validator_name="TestValidator")
+        machine.current_state = ValidatorState.INACTIVE
+        assert machine.get_alert_threshold() == "recovery"
+
     def test_should_alert_local_timeout_new_validator(self):
         """Test that local_timeout alerts are suppressed for NEW validators"""
         machine = ValidatorStateMachine(validator_name="TestValidator")
@@ -230,7 +239,7 @@ class TestValidatorStateMachine:
 
     def test_transition_history(self):
         """Test that transition history is tracked"""
-        machine = ValidatorStateMachine(validator_name="TestValidator")
+        machine = ValidatorStateMachine(validator_name="TestValidator", keep_history=True)
 
         machine.update(is_active=True, is_ever_active=True)
         machine.update(is_active=False, is_ever_active=True)
@@ -239,6 +248,30 @@ class TestValidatorStateMachine:
         history = machine.get_transition_history()
         assert len(history) == 3  # 3 transitions
 
+    def test_transition_history_off_by_default(self):
+        """Test that history is not kept unless requested, but still counted"""
+        machine = ValidatorStateMachine(validator_name="TestValidator")
+
+        machine.update(is_active=True, is_ever_active=True)
+
+        assert machine.get_transition_history() == []
+        assert machine.to_dict()["transition_count"] == 1
+
+    def test_transition_history_is_bounded(self):
+        """Test that history is capped but the persisted count is not"""
+        machine = ValidatorStateMachine(validator_name="TestValidator", keep_history=True)
+        limit = ValidatorStateMachine.MAX_TRANSITION_HISTORY
+
+        for i in range(limit + 10):
+            machine.update(is_active=(i % 2 == 0), is_ever_active=True)
+
+        history = machine.get_transition_history()
+        assert len(history) == limit
+        assert machine.to_dict()["transition_count"] == limit + 10
+
+        restored = ValidatorStateMachine.from_dict(machine.to_dict())
+        assert restored.to_dict()["transition_count"] == limit + 10
+
     def test_get_state_duration(self):
         """Test getting time in current state"""
         import time
@@ -393,6 +426,26 @@ class TestFilePersistence:
         assert data["validator_name"] == "TestValidator"
         assert data["current_state"] == "active"
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_state_files_are_indented(self, tmp_path, request, orjson_available):
+        """Test state files keep the indent=2 layout operators read, with or without orjson"""
+        if orjson_available:
+            pytest.importorskip("orjson")
+            module = sys.modules["monad_monitor.state_machine"]
+        else:
+            module = request.getfixturevalue("import_without_orjson")("state_machine")
+
+        machine = module.ValidatorStateMachine(validator_name="TestValidator")
+        single = tmp_path / "state.json"
+        aggregated = tmp_path / "validator_state.json"
+        machine.save_state(str(single))
+        persistence = module.StatePersistenceService(str(aggregated), [machine])
+        persistence.submit(machine)
+        assert persistence.close() is True
+
+        assert '\n  "validator_name": "TestValidator"' in single.read_text()
+        assert '\n  "TestValidator": {\n    "validator_name"' in aggregated.read_text()
+
     def test_load_state_from_file(self, tmp_path):
         """Test loading state machine from JSON file"""
         machine = ValidatorStateMachine(validator_name="TestValidator")
@@ -464,6 +517,24 @@ class TestFilePersistence:
         # Cleanup - restore permissions for temp dir cleanup
         os.chmod(readonly_dir, stat.S_IRWXU)
 
+    def test_save_state_skips_write_when_unchanged(self, tmp_path):
+        """Test that save_state only rewrites the file after a state change"""
+        machine = ValidatorStateMachine(validator_name="TestValidator")
+        state_file = tmp_path / "state.json"
+        filepath = str(state_file)
+
+        assert machine.save_state(filepath) is True
+        state_file.write_text("sentinel")
+
+        # No transition: nothing to write
+        assert machine.save_state(filepath) is True
+        assert state_file.read_text() == "sentinel"
+
+        # Transition: file is rewritten
+        machine.update(is_active=True, is_ever_active=True)
+        assert machine.save_state(filepath) is True
+        assert ValidatorStateMachine.load_state(filepath).current_state == ValidatorState.ACTIVE
+
     def test_save_and_load_preserves_inactive_state(self, tmp_path):
         """Test that INACTIVE state is preserved through save/load cycle"""
         machine = ValidatorStateMachine(validator_name="TestValidator")
@@ -477,3 +548,141 @@ class TestFilePersistence:
 
         assert loaded.current_state == ValidatorState.INACTIVE
         assert loaded.validator_name == "TestValidator"
+
+    def test_persistence_service_and_load_all_roundtrip(self, tmp_path):
+        """Test that the persistence service and load_all share one aggregated file"""
+        active = ValidatorStateMachine(validator_name="Validator1")
+        active.update(is_active=True, is_ever_active=True)
+        new = ValidatorStateMachine(validator_name="Validator2")
+
+        filepath = str(tmp_path / "validator_state.json")
+        persistence = StatePersistenceService(filepath, [active, new])
+        persistence.submit(active)
+        result = persistence.close()
+
+        assert result is True
+        assert not tmp_path.joinpath("validator_state.json.tmp").exists()
+
+        loaded = ValidatorStateMachine.load_all(filepath)
+
+        assert set(loaded) == {"Validator1", "Validator2"}
+        assert loaded["Validator1"].current_state == ValidatorState.ACTIVE
+        assert loaded["Validator2"].current_state == ValidatorState.NEW
+        assert loaded["Validator2"].validator_name == "Validator2"
+
+    def test_state_files_without_orjson(self, tmp_path, import_without_orjson):
+        """Test the stdlib json fallback writes state files either path can read"""
+        import json
+
+        state_machine = import_without_orjson("state_machine")
+        assert state_machine._json_loads is json.loads
+
+        machine = state_machine.ValidatorStateMachine(validator_name="Validator1")
+        machine.update(is_active=True, is_ever_active=True)
+        single = str(tmp_path / "state.json")
+        aggregated = str(tmp_path / "validator_state.json")
+
+        assert machine.save_state(single) is True
+        persistence = state_machine.StatePersistenceService(aggregated, [machine])
+        persistence.submit(machine)
+        assert persistence.close() is True
+
+        assert state_machine.ValidatorStateMachine.load_state(single).validator_name == "Validator1"
+        loaded = ValidatorStateMachine.load_all(aggregated)
+        assert loaded["Validator1"].current_state == ValidatorState.ACTIVE
+
+    def test_load_all_missing_file_returns_empty(self, tmp_path):
+        """Test that a missing aggregated file yields no machines"""
+        assert ValidatorStateMachine.load_all(str(tmp_path / "nonexistent.json")) == {}
+
+    def test_load_all_corrupted_file_returns_empty(self, tmp_path):
+        """Test that a corrupted aggregated file yields no machines"""
+        filepath = str(tmp_path / "corrupted.json")
+        with open(filepath, "w") as f:
+            f.write("{ invalid json content")
+
+        assert ValidatorStateMachine.load_all(filepath) == {}
+
+    def test_persistence_service_writes_latest_snapshot(self, tmp_path):
+        """Test StatePersistenceService coalesces submits into the aggregated file"""
+        filepath = str(tmp_path / "validator_state.json")
+        idle = ValidatorStateMachine("idle-validator")
+        busy = ValidatorStateMachine("busy-validator")
+
+        service = StatePersistenceService(filepath, [idle, busy])
+        busy.update(is_active=True, is_ever_active=True)
+        service.submit(busy)
+        busy.update(is_active=False, is_ever_active=True)
+        service.submit(busy)
+        assert service.close() is True
+
+        loaded = ValidatorStateMachine.load_all(filepath)
+        assert loaded["idle-validator"].current_state == ValidatorState.NEW
+        assert loaded["busy-validator"].current_state == ValidatorState.INACTIVE
+
+    def test_persistence_service_appends_transition_log(self, tmp_path):
+        """Test submitted transitions are appended to the transition log"""
+        filepath = str(tmp_path / "validator_state.json")
+        log_path = str(tmp_path / "validator_transitions.jsonl")
+        machine = ValidatorStateMachine("TestValidator")
+
+        service = StatePersistenceService(filepath, [machine], transition_log_path=log_path)
+        service.submit(machine, machine.update(is_active=True, is_ever_active=True))
+        service.submit(machine, machine.update(is_active=False, is_ever_active=True))
+        assert service.close() is True
+
+        transitions = ValidatorStateMachine.load_transition_log(log_path)
+        assert [(t.from_state, t.to_state) for t in transitions] == [
+            (ValidatorState.NEW, ValidatorState.ACTIVE),
+            (ValidatorState.ACTIVE, ValidatorState.INACTIVE),
+        ]
+        assert transitions[0].validator_name == "TestValidator"
+
+    def test_load_transition_log_skips_corrupted_lines(self, tmp_path):
+        """Test that a truncated log line does not discard the rest of the log"""
+        import json
+
+        transition = StateTransition(
+            from_state=ValidatorState.NEW,
+            to_state=ValidatorState.ACTIVE,
+            validator_name="TestValidator",
+            timestamp=1700000000.0,
+            metadata={"source": "test"},
+        )
+        log_path = tmp_path / "validator_transitions.jsonl"
+        log_path.write_text(json.dumps(transition.to_dict()) + "\n" + '{"t": 17000')
+
+        transitions = ValidatorStateMachine.load_transition_log(str(log_path))
+
+        assert transitions == [transition]
+        assert transitions[0].metadata["source"] == "test"
+
+    def test_transition_log_rotates_at_size_cap(self, tmp_path):
+        """Test the transition log is rotated instead of growing without bound"""
+        from monad_monitor.state_machine import _append_transition_log
+
+        log_path = str(tmp_path / "validator_transitions.jsonl")
+        entries = [
+            StateTransition(
+                from_state=ValidatorState.NEW,
+                to_state=ValidatorState.ACTIVE,
+                validator_name=f"Validator{i}",
+                timestamp=1700000000.0 + i,
+            ).to_dict()
+            for i in range(3)
+        ]
+
+        for entry in entries:
+            assert _append_transition_log(log_path, [entry], max_bytes=150) is True
+
+        assert (tmp_path / "validator_transitions.jsonl.1").exists()
+        assert (tmp_path / "validator_transitions.jsonl").stat().st_size <= 150
+        # Rotated generation is read first, so order is preserved
+        transitions = ValidatorStateMachine.load_transition_log(log_path)
+        names = [t.validator_name for t in transitions]
+        assert names == sorted(names)
+        assert names[-1] == "Validator2"
+
+    def test_load_transition_log_missing_file_returns_empty(self, tmp_path):
+        """Test that a missing transition log yields no transitions"""
+        assert ValidatorStateMachine.load_transition_log(str(tmp_path / "missing.jsonl")) == []
@@ -136,7 +136,8 @@ class TestHealthStatus:
         assert status.peers is None
         assert status.is_syncing is False
         assert status.rpc_healthy is None
-        assert status.warnings == []
+        assert status.warnings == ()
+        assert status.criticals == ()
 
     def test_health_status_with_warnings(self):
         """Test HealthStatus with warnings"""
@@ -204,6 +205,21 @@ class TestValidatorConfig:
         assert sample_validator_config_no_node_exporter.node_exporter_url is None
 
 
+class TestSystemThresholdCheck:
+    def test_cpu_memory_disk_levels(self):
+        from monad_monitor.validator import SystemThresholds, ValidatorHealthChecker
+        checker = ValidatorHealthChecker.__new__(ValidatorHealthChecker)
+        checker.thresholds = SystemThresholds()
+        system_metrics = {
+            "cpu_used_percent": 96.0,
+            "mem_percent": 91.0,
+            "disk_percent": 50.0,
+        }
+        warnings, criticals = checker._check_system_thresholds(system_metrics)
+        assert criticals == ["CPU critical: 96.0%"]
+        assert warnings == ["Memory warning: 91.0%"]
+
+
 class TestNvmeThresholdCheck:
     def test_nvme_wear_warning(self):
         from monad_monitor.validator import SystemThresholds, ValidatorHealthChecker